@@ -1,7 +1,7 @@
 import asyncio
 import sys
 from functools import wraps
-from typing import Literal, Callable, Union
+from typing import Any, Awaitable, Literal, Callable, Union
 from asyncio import Semaphore
 
 import ccxt.pro as ccxt
@@ -10,29 +10,25 @@ from dataclasses import dataclass, field
 
 from async_lru import alru_cache
 
-from crypto_pandas.ccxt.base_processor import BaseProcessor
+from crypto_pandas.ccxt.base_pandas_exchange import BasePandasExchange
 from crypto_pandas.ccxt.method_mappings import (
-    bulk_order_methods,
-    single_order_methods,
-    symbol_order_methods,
-    modified_methods,
+    async_modified_methods,
+    market_loading_methods,
+    market_order_methods,
+    order_action_methods,
+    read_methods,
 )
 from crypto_pandas.utils.async_ccxt_pandas_exchange_typed import (
     AsyncCCXTPandasExchangeTyped,
 )
-from crypto_pandas.utils.pandas_utils import (
-    timestamp_to_int,
-    preprocess_order,
-    preprocess_order_dataframe,
-)
-from crypto_pandas.utils.utils import exchange_has_method
+from crypto_pandas.utils.pandas_utils import async_concat_results
 
 if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
 @dataclass
-class AsyncCCXTPandasExchange(AsyncCCXTPandasExchangeTyped):
+class AsyncCCXTPandasExchange(BasePandasExchange, AsyncCCXTPandasExchangeTyped):
     """
     An asynchronous wrapper class for ccxt Exchange that integrates pandas for enhanced data handling
     and provides preprocessing utilities for working with cryptocurrency trading data.
@@ -55,9 +51,28 @@ class AsyncCCXTPandasExchange(AsyncCCXTPandasExchangeTyped):
         price_out_of_range (str): Defines behavior when price exceeds allowable ranges. Options include:
             - "warn": Logs a warning while removing the order.
             - "clip": Adjusts the price to fit within predefined limits.
+        max_retries (int): Number of times a call failing with a transient network error is retried.
+            Order actions are only retried when rejected by rate limiting. Defaults to 0, no retries.
+        retry_base_delay (float): Delay in seconds before the first retry, doubled on every attempt.
+        retry_max_delay (float): Maximum delay in seconds between retries.
+        circuit_breaker_threshold (int): Number of consecutive network errors after which calls fail
+            fast with `ccxt.ExchangeNotAvailable`. Defaults to 0, disabled.
+        circuit_breaker_cooldown (float): Seconds before a single probe call is let through an open circuit.
+        response_cache_time (dict[str, float]): Seconds for which the results of the given fetch methods
+            are cached by arguments, e.g. {"fetch_trading_fees": 60}. Defaults to no caching.
+        stale_if_error (bool): Whether a cached method failing with a network error returns its last
+            result instead of raising.
         semaphore_value (int): The value for the asyncio Semaphore controlling concurrent requests.
+        order_semaphore_value (int | None): If set, order actions (create, edit and cancel calls)
+            and the market loading they depend on are limited by their own semaphore of this size
+            instead of sharing `semaphore_value` with other calls, so that they do not wait for a
+            slot behind slow polling. They still share the exchange's rate limiter.
+        coalesce_requests (bool): Whether concurrent identical fetch calls share a single request,
+            each caller receiving its own copy of the result.
         _ccxt_processor (BaseProcessor): The processor handling preprocessing tasks for ccxt methods.
         _semaphore (Semaphore): An asyncio Semaphore instance to limit concurrency.
+        _order_semaphore (Semaphore | None): The semaphore reserved for order actions and market loading, if any.
+        _in_flight (dict): Pending coalesced requests by call key.
 
     Methods:
         __getattr__(method_name: str) -> Callable:
@@ -65,105 +80,208 @@ class AsyncCCXTPandasExchange(AsyncCCXTPandasExchangeTyped):
 
         load_cached_markets(params: dict = {}) -> pd.DataFrame:
             Loads and caches markets data asynchronously, with optional parameters for customization.
+
+        gather_for_symbols(method_name: str, symbols: list[str], errors: str = "raise", **kwargs) -> pd.DataFrame:
+            Calls a method for each symbol concurrently and concatenates the results.
+
+        gather_methods(calls: list[tuple[str, dict]]) -> list:
+            Calls several different methods concurrently and returns their results in order.
     """
 
     exchange: ccxt.Exchange = field(default_factory=ccxt.binance)
-    exchange_name: str | None = None
-    account_name: str | None = None
-    dropna_fields: bool = True
-    attach_trades_to_orders: bool = False
-    max_order_cost: float = 10_000
-    max_number_of_orders: int = 5
-    markets_cache_time: int = 3600
-    cost_out_of_range: Literal["warn", "clip"] = "warn"
-    amount_out_of_range: Literal["warn", "clip"] = "warn"
-    price_out_of_range: Literal["warn", "clip"] = "warn"
     semaphore_value: int = 1000
-    _ccxt_processor: BaseProcessor = field(default_factory=BaseProcessor)
+    order_semaphore_value: int | None = None
+    coalesce_requests: bool = False
     _semaphore: Semaphore = field(default_factory=Semaphore)
+    _order_semaphore: Semaphore | None = field(init=False, repr=False, default=None)
+    _in_flight: dict = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _cached_load_markets: Callable = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self):
-        if self.exchange_name is None:
-            self.exchange_name = self.exchange.id
-        self._ccxt_processor = BaseProcessor(
-            exchange_name=self.exchange_name,
-            account_name=self.account_name,
-            dropna_fields=self.dropna_fields,
-            attach_trades_to_orders=self.attach_trades_to_orders,
-            cost_out_of_range=self.cost_out_of_range,
-            amount_out_of_range=self.amount_out_of_range,
-            price_out_of_range=self.price_out_of_range,
-        )
+        super().__post_init__()
         self._semaphore = Semaphore(self.semaphore_value)
+        if self.order_semaphore_value:
+            self._order_semaphore = Semaphore(self.order_semaphore_value)
+
+        # Built once so the TTL cache outlives a single load_cached_markets call.
+        @alru_cache(ttl=self.markets_cache_time)
+        async def cached_load_markets() -> pd.DataFrame:
+            return await self.load_markets(reload=True)
+
+        self._cached_load_markets = cached_load_markets
 
     def __getattribute__(self, method_name: str) -> Callable:
-        if method_name not in modified_methods | {"close"}:
+        if method_name not in async_modified_methods:
             return super().__getattribute__(method_name)
         original_method = getattr(self.exchange, method_name)
+        cached = self._wrapped_methods.get(method_name)
+        if cached is not None and cached.__wrapped__ == original_method:
+            return cached
+        # Resolved once per method instead of on every call.
+        needs_markets = method_name in market_order_methods
+        is_read = method_name in read_methods
+        # Orders wait on the markets, so loading them must not queue behind polling either.
+        uses_order_semaphore = (
+            method_name in order_action_methods or method_name in market_loading_methods
+        )
+        is_coroutine = asyncio.iscoroutinefunction(original_method)
+        is_close = method_name == "close"
+        preprocess_kwargs = self._preprocess_kwargs
+        preprocess_outputs = self._ccxt_processor.preprocess_outputs
+        retry_delay = self._retry_delay
 
-        async def preprocess_kwargs(kwargs: dict) -> dict:
-            if "since" in kwargs:
-                kwargs["since"] = timestamp_to_int(kwargs["since"])
-            if method_name in single_order_methods:
-                kwargs["amount"], kwargs["price"] = preprocess_order(
-                    exchange=self.exchange,
-                    symbol=kwargs["symbol"],
-                    order_type=kwargs["type"],
-                    amount=kwargs.get("amount"),
-                    price=kwargs.get("price"),
-                    cost=kwargs.get("cost"),
-                    markets=await self.load_cached_markets(),
-                    max_cost=self.max_order_cost,
-                    price_out_of_range=self.price_out_of_range,
-                    amount_out_of_range=self.amount_out_of_range,
-                )
-                if "cost" in kwargs:
-                    kwargs.pop("cost")
-            elif method_name in bulk_order_methods:
-                kwargs["orders"] = preprocess_order_dataframe(
-                    orders=kwargs["orders"],
-                    markets=await self.load_cached_markets(),
-                    max_orders=self.max_number_of_orders,
-                    max_cost=self.max_order_cost,
-                    price_out_of_range=self.price_out_of_range,
-                    amount_out_of_range=self.amount_out_of_range,
-                )
-                kwargs["orders"] = self._ccxt_processor.orders_to_dict(
-                    kwargs["orders"], exchange=self.exchange
-                )
-            elif method_name in symbol_order_methods:
-                kwargs["orders"] = kwargs["orders"][["id", "symbol"]].to_dict("records")
-            return kwargs
+        async def send(args: tuple, kwargs: dict) -> Union[dict, pd.DataFrame]:
+            semaphore = (
+                self._order_semaphore
+                if uses_order_semaphore and self._order_semaphore
+                else self._semaphore
+            )
+            attempt = 0
+            while True:
+                self._check_circuit()
+                try:
+                    async with semaphore:
+                        result = original_method(*args, **kwargs)
+                        if is_coroutine:
+                            result = await result
+                    break
+                except ccxt.NetworkError as error:
+                    self._record_call(error)
+                    delay = retry_delay(method_name, attempt, error)
+                    if delay is None:
+                        raise
+                    # Backoff outside the semaphore so other calls can proceed.
+                    await asyncio.sleep(delay)
+                    attempt += 1
+            self._record_call()
+            return preprocess_outputs(
+                method_name=method_name, result=result, symbol=kwargs.get("symbol")
+            )
 
         @wraps(original_method)
         async def wrapped(*args, **kwargs) -> Union[dict, pd.DataFrame, asyncio.Future]:
-            kwargs = await preprocess_kwargs(kwargs=kwargs)
-            async with self._semaphore:
-                if asyncio.iscoroutinefunction(original_method):
-                    result = await original_method(*args, **kwargs)
-                    return self._ccxt_processor.preprocess_outputs(
-                        method_name=method_name,
-                        result=result,
-                        symbol=kwargs.get("symbol"),
+            if is_close:
+                # Tearing down the session must work even while the circuit is open.
+                return await original_method(*args, **kwargs)
+            markets = await self.load_cached_markets() if needs_markets else None
+            kwargs = preprocess_kwargs(
+                method_name=method_name, kwargs=kwargs, markets=markets
+            )
+            if not is_read:
+                return await send(args, kwargs)
+            ttl = self.response_cache_time.get(method_name)
+            if not (ttl or self.coalesce_requests):
+                return await send(args, kwargs)
+            key = self._request_key(method_name, args, kwargs)
+            if ttl:
+                result = self._cached_response(key)
+                if result is not None:
+                    return result
+            try:
+                if self.coalesce_requests:
+                    result = await self._single_flight(
+                        key=key, call=lambda: send(args, kwargs)
                     )
                 else:
-                    result = original_method(*args, **kwargs)
-                    return self._ccxt_processor.preprocess_outputs(
-                        method_name=method_name,
-                        result=result,
-                        symbol=kwargs.get("symbol"),
-                    )
+                    result = await send(args, kwargs)
+            except ccxt.NetworkError:
+                if not (ttl and self.stale_if_error):
+                    raise
+                result = self._cached_response(key, stale=True)
+                if result is None:
+                    raise
+                return result
+            if ttl:
+                self._cache_response(key, ttl, result)
+                return self._copy_result(result)
+            return result
 
+        self._wrapped_methods[method_name] = wrapped
         return wrapped
 
+    async def _single_flight(self, key: bytes, call: Callable[[], Awaitable]) -> Any:
+        """
+        Runs a call once for all concurrent callers sharing the same key.
+
+        Args:
+            key (bytes): The key identifying the call.
+            call (Callable[[], Awaitable]): Starts the call, only invoked if none is pending.
+
+        Returns:
+            Any: A copy of the call result, so callers can modify it independently.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+
+            async def run() -> Any:
+                try:
+                    return await call()
+                finally:
+                    del self._in_flight[key]
+
+            task = asyncio.ensure_future(run())
+            self._in_flight[key] = task
+        # Shielded so that one cancelled caller does not cancel the request for the others.
+        return self._copy_result(await asyncio.shield(task))
+
     async def load_cached_markets(self, params: dict = {}) -> pd.DataFrame:
+        """
+        Loads market data from the exchange and caches it for `markets_cache_time` seconds.
 
-        @alru_cache(ttl=self.markets_cache_time)
-        async def _cached_load_markets() -> pd.DataFrame:
-            async with self._semaphore:
-                return await self.load_markets(reload=True, params=params)
+        Args:
+            params (dict, optional): Additional parameters for the exchange's market-loading function.
+                Defaults to an empty dictionary. Calls with params bypass the cache.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the market data.
+        """
+        if params:
+            return await self.load_markets(reload=True, params=params)
+        return await self._cached_load_markets()
+
+    async def gather_for_symbols(
+        self,
+        method_name: str,
+        symbols: list[str],
+        errors: Literal["raise", "warn", "ignore"] = "raise",
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Calls a method for each symbol concurrently and concatenates the results.
+
+        Requests share the exchange session and are bounded by the semaphore, so N symbols
+        cost roughly one round-trip instead of N sequential ones.
 
-        return await _cached_load_markets()
+        Args:
+            method_name (str): Name of a symbol-based method, e.g. "fetch_ohlcv" or "fetch_ticker".
+            symbols (list[str]): Symbols to request.
+            errors (str): Behavior for failed requests, one of "raise", "warn" or "ignore".
+            **kwargs: Additional keyword arguments passed to every call.
 
-    def has_method(self, method_name: str) -> bool:
-        return exchange_has_method(self.exchange, method_name)
+        Returns:
+            pd.DataFrame: The concatenated results of all symbols.
+        """
+        method = getattr(self, method_name)
+        return await async_concat_results(
+            tasks=[method(symbol=symbol, **kwargs) for symbol in symbols],
+            errors=errors,
+        )
+
+    async def gather_methods(self, calls: list[tuple[str, dict]]) -> list:
+        """
+        Calls several methods concurrently, e.g. the balance, open orders and trades of an account.
+
+        Args:
+            calls (list[tuple[str, dict]]): Method names with the keyword arguments of each call,
+                e.g. [("fetch_balance", {}), ("fetch_my_trades", {"symbol": "BTC/USDT"})].
+
+        Returns:
+            list: The result of each call, in the order of `calls`. The first failed call raises.
+        """
+        return await asyncio.gather(
+            *[getattr(self, method_name)(**kwargs) for method_name, kwargs in calls]
+        )
@@ -0,0 +1,320 @@
+import copy
+import random
+import threading
+import time
+from typing import Any, Literal
+
+import ccxt
+import orjson
+import pandas as pd
+from dataclasses import dataclass, field
+
+from crypto_pandas.ccxt.base_processor import BaseProcessor
+from crypto_pandas.ccxt.method_mappings import (
+    bulk_order_methods,
+    order_action_methods,
+    single_order_methods,
+    symbol_order_methods,
+)
+from crypto_pandas.utils.pandas_utils import (
+    dataframe_to_records,
+    timestamp_to_int,
+    preprocess_order,
+    preprocess_order_dataframe,
+)
+from crypto_pandas.utils.utils import exchange_has_method
+
+order_sides = frozenset({"buy", "sell"})
+max_cached_responses = 1024
+
+
+@dataclass
+class BasePandasExchange:
+    """
+    Configuration and input preprocessing shared by CCXTPandasExchange and
+    AsyncCCXTPandasExchange. Subclasses only differ in how they call the exchange
+    and load markets.
+
+    Attributes:
+        exchange (ccxt.Exchange): An instance of the CCXT exchange client.
+        exchange_name (str | None): The name of the exchange to interact with.
+        account_name (str | None): The account name, if required for tracking.
+        dropna_fields (bool): Determines whether empty (NaN) columns are removed from DataFrame outputs.
+        attach_trades_to_orders (bool): Determines whether trades are attached to orders when processing orders.
+        max_order_cost (float): Maximum cost value for any single order.
+        max_number_of_orders (int): Maximum number of bulk orders allowed.
+        markets_cache_time (int): Cache duration (in seconds) for markets data.
+        cost_out_of_range (str): Defines behavior when cost exceeds acceptable ranges.
+        amount_out_of_range (str): Defines behavior when volume exceeds acceptable ranges.
+        price_out_of_range (str): Defines behavior when price exceeds allowable ranges.
+        max_retries (int): Number of times a call failing with a transient network error is retried.
+            Order actions are only retried when rejected by rate limiting, as other errors may
+            have reached the exchange. Defaults to 0, no retries.
+        retry_base_delay (float): Delay in seconds before the first retry, doubled on every attempt.
+        retry_max_delay (float): Maximum delay in seconds between retries.
+        circuit_breaker_threshold (int): Number of consecutive network errors after which calls fail
+            fast with `ccxt.ExchangeNotAvailable` instead of reaching the exchange. Defaults to 0, disabled.
+        circuit_breaker_cooldown (float): Seconds before a single probe call is let through an open circuit.
+        response_cache_time (dict[str, float]): Seconds for which the results of the given fetch methods
+            are cached by arguments, e.g. {"fetch_trading_fees": 60}. Defaults to no caching.
+        stale_if_error (bool): Whether a cached method failing with a network error returns its last
+            result, even once expired, instead of raising.
+        _ccxt_processor (BaseProcessor): A helper class to process CCXT responses and provide consistent output.
+        _wrapped_methods (dict): Wrapped exchange methods by name, built on first access.
+        _consecutive_failures (int): Network errors since the last successful call.
+        _circuit_opened_at (float): Monotonic time at which the circuit was last opened or probed.
+        _circuit_lock (threading.Lock): Guards the circuit breaker state across threads.
+        _response_cache (dict): Cached results by call key, with their expiry time.
+        _response_cache_lock (threading.Lock): Guards the response cache across threads.
+    """
+
+    exchange: ccxt.Exchange = field(default_factory=ccxt.binance)
+    exchange_name: str | None = None
+    account_name: str | None = None
+    dropna_fields: bool = True
+    attach_trades_to_orders: bool = False
+    max_order_cost: float = 10_000
+    max_number_of_orders: int = 5
+    markets_cache_time: int = 3600
+    cost_out_of_range: Literal["warn", "clip"] = "warn"
+    amount_out_of_range: Literal["warn", "clip"] = "warn"
+    price_out_of_range: Literal["warn", "clip"] = "warn"
+    max_retries: int = 0
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    circuit_breaker_threshold: int = 0
+    circuit_breaker_cooldown: float = 10.0
+    response_cache_time: dict[str, float] = field(default_factory=dict)
+    stale_if_error: bool = False
+    _ccxt_processor: BaseProcessor = field(default_factory=BaseProcessor)
+    _wrapped_methods: dict = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _consecutive_failures: int = field(init=False, repr=False, compare=False, default=0)
+    _circuit_opened_at: float = field(
+        init=False, repr=False, compare=False, default=0.0
+    )
+    _circuit_lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+    _response_cache: dict = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _response_cache_lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+
+    def __post_init__(self):
+        if self.exchange_name is None:
+            self.exchange_name = self.exchange.id
+        self._ccxt_processor = BaseProcessor(
+            exchange_name=self.exchange_name,
+            account_name=self.account_name,
+            dropna_fields=self.dropna_fields,
+            attach_trades_to_orders=self.attach_trades_to_orders,
+            cost_out_of_range=self.cost_out_of_range,
+            amount_out_of_range=self.amount_out_of_range,
+            price_out_of_range=self.price_out_of_range,
+        )
+
+    def _preprocess_kwargs(
+        self, method_name: str, kwargs: dict, markets: pd.DataFrame | None = None
+    ) -> dict:
+        """
+        Converts user-friendly inputs into the arguments expected by ccxt.
+
+        Args:
+            method_name (str): The name of the wrapped method.
+            kwargs (dict): The keyword arguments of the call.
+            markets (pd.DataFrame | None): The cached markets, required for order methods.
+
+        Returns:
+            dict: The preprocessed keyword arguments.
+        """
+        if "since" in kwargs:
+            kwargs["since"] = timestamp_to_int(kwargs["since"])
+        params = kwargs.get("params")
+        if params:
+            # ccxt would otherwise send None values as the string "None".
+            params = {key: value for key, value in params.items() if value is not None}
+            if "until" in params:
+                params["until"] = timestamp_to_int(params["until"])
+            kwargs["params"] = params
+        if method_name in single_order_methods:
+            # Rejected here rather than after a round-trip to the exchange.
+            side = kwargs.get("side")
+            if side is not None and str(side).lower() not in order_sides:
+                raise ValueError(f"Invalid order side {side}, expected buy or sell.")
+            kwargs["amount"], kwargs["price"] = preprocess_order(
+                exchange=self.exchange,
+                symbol=kwargs["symbol"],
+                order_type=kwargs["type"],
+                amount=kwargs.get("amount"),
+                price=kwargs.get("price"),
+                cost=kwargs.get("cost"),
+                markets=markets,
+                max_cost=self.max_order_cost,
+                cost_out_of_range=self.cost_out_of_range,
+                amount_out_of_range=self.amount_out_of_range,
+                price_out_of_range=self.price_out_of_range,
+            )
+            if "cost" in kwargs:
+                kwargs.pop("cost")
+        elif method_name in bulk_order_methods:
+            kwargs["orders"] = preprocess_order_dataframe(
+                orders=kwargs["orders"],
+                markets=markets,
+                max_orders=self.max_number_of_orders,
+                max_cost=self.max_order_cost,
+                cost_out_of_range=self.cost_out_of_range,
+                amount_out_of_range=self.amount_out_of_range,
+                price_out_of_range=self.price_out_of_range,
+            )
+            kwargs["orders"] = self._ccxt_processor.orders_to_dict(
+                orders=kwargs["orders"],
+                exchange=self.exchange,
+            )
+        elif method_name in symbol_order_methods:
+            kwargs["orders"] = dataframe_to_records(
+                kwargs["orders"], columns=["id", "symbol"]
+            )
+        return kwargs
+
+    def _retry_delay(
+        self, method_name: str, attempt: int, error: Exception
+    ) -> float | None:
+        """
+        Returns the backoff before retrying a failed call, or None if it should be raised.
+
+        Args:
+            method_name (str): The name of the wrapped method.
+            attempt (int): The number of retries already made.
+            error (Exception): The error raised by the call.
+
+        Returns:
+            float | None: Exponential delay in seconds with up to 50% jitter.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if method_name in order_action_methods:
+            # Rejected before reaching the matching engine, safe to send again.
+            retryable = (ccxt.DDoSProtection, ccxt.RateLimitExceeded)
+        else:
+            retryable = ccxt.NetworkError
+        if not isinstance(error, retryable):
+            return None
+        delay = self.retry_base_delay * 2**attempt * (1 + random.random() / 2)
+        return min(delay, self.retry_max_delay)
+
+    def _check_circuit(self) -> None:
+        """
+        Fails fast while the circuit is open, letting one probe call through after the cooldown.
+
+        Raises:
+            ccxt.ExchangeNotAvailable: If recent calls kept failing with network errors.
+        """
+        if not self.circuit_breaker_threshold:
+            return
+        with self._circuit_lock:
+            if self._consecutive_failures < self.circuit_breaker_threshold:
+                return
+            now = time.monotonic()
+            remaining = self._circuit_opened_at + self.circuit_breaker_cooldown - now
+            if remaining > 0:
+                raise ccxt.ExchangeNotAvailable(
+                    f"{self.exchange_name} circuit open after {self._consecutive_failures} "
+                    f"consecutive network errors, retry in {remaining:.1f}s."
+                )
+            # Half open, this call is the probe and the others keep failing fast meanwhile.
+            self._circuit_opened_at = now
+
+    def _record_call(self, error: Exception | None = None) -> None:
+        """
+        Updates the circuit breaker with the outcome of a call.
+
+        Args:
+            error (Exception | None): The network error raised by the call, None if it succeeded.
+        """
+        if not self.circuit_breaker_threshold:
+            return
+        with self._circuit_lock:
+            if error is None:
+                self._consecutive_failures = 0
+                return
+            self._consecutive_failures += 1
+            if self._consecutive_failures == self.circuit_breaker_threshold:
+                self._circuit_opened_at = time.monotonic()
+
+    @staticmethod
+    def _request_key(method_name: str, args: tuple, kwargs: dict) -> bytes:
+        """
+        Returns a key identifying a call, equal for calls with the same arguments.
+
+        Args:
+            method_name (str): The name of the wrapped method.
+            args (tuple): The positional arguments of the call.
+            kwargs (dict): The preprocessed keyword arguments of the call.
+
+        Returns:
+            bytes: The serialized call.
+        """
+        return orjson.dumps(
+            [method_name, args, kwargs],
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+
+    def _cached_response(self, key: bytes, stale: bool = False) -> Any:
+        """
+        Returns a copy of the cached result of a call, or None if there is none.
+
+        Args:
+            key (bytes): The key identifying the call.
+            stale (bool): Whether an expired result is returned as well.
+
+        Returns:
+            Any: The cached result, copied so that callers cannot modify the cache.
+        """
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+        if entry is None or (not stale and entry[0] < time.monotonic()):
+            return None
+        return self._copy_result(entry[1])
+
+    def _cache_response(self, key: bytes, ttl: float, result: Any) -> None:
+        """
+        Caches the result of a call, evicting the oldest entry once the cache is full.
+
+        Args:
+            key (bytes): The key identifying the call.
+            ttl (float): Seconds for which the result is fresh.
+            result (Any): The preprocessed result of the call.
+        """
+        cache = self._response_cache
+        with self._response_cache_lock:
+            # Reinserted so that insertion order stays oldest first.
+            cache.pop(key, None)
+            if len(cache) >= max_cached_responses:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = (time.monotonic() + ttl, result)
+
+    @staticmethod
+    def _copy_result(result: Any) -> Any:
+        """
+        Copies a result shared between callers, e.g. from the response cache.
+
+        DataFrames are copied with their data, dictionaries and lists recursively, so
+        that modifying the copy leaves the shared result unchanged.
+
+        Args:
+            result (Any): The preprocessed result of a call.
+
+        Returns:
+            Any: An independent copy of the result.
+        """
+        if isinstance(result, (dict, list)):
+            return copy.deepcopy(result)
+        return copy.copy(result)
+
+    def has_method(self, method_name: str) -> bool:
+        return exchange_has_method(self.exchange, method_name)
@@ -8,40 +8,159 @@ and other common transformations needed for trading data, such as orders, order
 
 Classes:
     BaseProcessor: Provides methods for preprocessing API responses from exchanges into pandas DataFrames.
+    ColumnPlan: Columns of a response schema grouped by the conversion they need.
 
 Attributes:
     possible_depth_meta (list): List of potential metadata fields found in order book depth data.
 """
 
 from dataclasses import dataclass, field
-from typing import Union, Literal
+from functools import lru_cache
+from typing import Callable, Union, Literal
 
 import ccxt
+import numpy as np
+import orjson
 import pandas as pd
 
-from crypto_pandas.ccxt.method_mappings import (
-    standard_dataframe_methods,
-    markets_dataframe_methods,
-    currencies_dataframe_methods,
-    balance_dataframe_methods,
-    ohlcv_dataframe_methods,
-    orderbook_dataframe_methods,
-    orderbooks_dataframe_methods,
-    orders_dataframe_methods,
-    ohlcv_symbols_dataframe_methods,
-    dict_methods,
-)
+from crypto_pandas.ccxt.method_mappings import output_processors
 from crypto_pandas.ccxt.order_schema import OrderSchema
 from crypto_pandas.utils.pandas_utils import (
+    ms_to_datetime,
+    column_to_numeric,
+    dataframe_to_records,
     expand_dict_columns,
     determine_mandatory_optional_fields_pandera,
+    normalize_records,
+    records_to_array,
+    values_to_precision,
 )
 from pandera.typing import DataFrame
 
 possible_depth_meta = ["symbol", "timestamp", "datetime", "nonce", "exchange", "T", "u"]
 
 
-@dataclass
+# ccxt already returns most numbers as int/float, for which pd.to_numeric is a no-op.
+_number_types = frozenset({int, float})
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnPlan:
+    """
+    Columns of a response schema grouped by the conversion they need, in column order.
+
+    Attributes:
+        int_datetime_columns (tuple): Columns holding epoch milliseconds.
+        str_datetime_columns (tuple): Columns holding ISO 8601 strings.
+        numeric_columns (tuple): Columns to cast to numeric types.
+        bool_columns (tuple): Columns to cast to booleans.
+    """
+
+    int_datetime_columns: tuple = ()
+    str_datetime_columns: tuple = ()
+    numeric_columns: tuple = ()
+    bool_columns: tuple = ()
+
+
+@lru_cache(maxsize=256)
+def plan_columns(
+    columns: tuple,
+    int_to_datetime_fields: frozenset | None,
+    str_to_datetime_fields: frozenset | None,
+    numeric_fields: frozenset | None,
+    bool_fields: frozenset | None,
+) -> ColumnPlan:
+    """
+    Build the ColumnPlan of a response schema.
+
+    Responses of a given method share the same columns, so plans are cached per
+    schema and field groups instead of being rebuilt on every call.
+
+    Args:
+        columns (tuple): Column names of the DataFrame.
+        int_to_datetime_fields (frozenset | None): Fields holding epoch milliseconds.
+        str_to_datetime_fields (frozenset | None): Fields holding datetime strings.
+        numeric_fields (frozenset | None): Fields to cast to numeric types.
+        bool_fields (frozenset | None): Fields to cast to booleans.
+
+    Returns:
+        ColumnPlan: The columns to convert, per conversion type.
+    """
+
+    def select(fields: frozenset | None) -> tuple:
+        return tuple(x for x in columns if x in fields) if fields else ()
+
+    return ColumnPlan(
+        int_datetime_columns=select(int_to_datetime_fields),
+        str_datetime_columns=select(str_to_datetime_fields),
+        numeric_columns=select(numeric_fields),
+        bool_columns=select(bool_fields),
+    )
+
+
+def _int_to_timestamp(value) -> pd.Timestamp:
+    if type(value) not in _number_types:
+        value = pd.to_numeric(value)
+    return pd.Timestamp(value, unit="ms", tz="UTC")
+
+
+def _str_to_timestamp(value) -> pd.Timestamp:
+    return pd.Timestamp(value, tz="UTC")
+
+
+def _value_to_numeric(value):
+    if type(value) in _number_types:
+        return value
+    return pd.to_numeric(value, errors="coerce")
+
+
+def _ints_to_timestamps(values: list) -> pd.DatetimeIndex:
+    return pd.to_datetime(pd.to_numeric(values), unit="ms", utc=True)
+
+
+def _strs_to_timestamps(values: list) -> pd.DatetimeIndex:
+    try:
+        return pd.to_datetime(values, utc=True, format="ISO8601")
+    except ValueError:
+        # Parsed one by one like pd.Timestamp, e.g. "Jan 2 2024".
+        return pd.to_datetime(values, utc=True, format="mixed")
+
+
+def _values_to_numeric(values: list) -> np.ndarray | list:
+    numbers = pd.to_numeric(values, errors="coerce")
+    if numbers.dtype.kind != "f":
+        return numbers
+    # A single decimal widens the batch to float64, whole numbers are parsed again on
+    # their own so that they keep the int64 type _value_to_numeric gives them.
+    whole = np.flatnonzero(numbers == np.trunc(numbers))
+    if not len(whole):
+        return numbers
+    numbers = list(numbers)
+    for i in whole:
+        numbers[i] = pd.to_numeric(values[i], errors="coerce")
+    return numbers
+
+
+_batch_converters = {
+    _int_to_timestamp: _ints_to_timestamps,
+    _str_to_timestamp: _strs_to_timestamps,
+    _value_to_numeric: _values_to_numeric,
+}
+
+
+def _is_batched(converter: Callable, value) -> bool:
+    # Numbers and nested values such as fee dicts are left to the converter itself,
+    # which passes them through unchanged.
+    return converter is not _value_to_numeric or type(value) is str
+
+
+def _keep_value(value) -> bool:
+    return bool(value) and (
+        isinstance(value, (list, set, tuple)) or bool(pd.notnull(value))
+    )
+
+
+@dataclass(slots=True)
 class BaseProcessor:
     """
     CCXTProcessor is a parent class for handling preprocessing of API responses into pandas DataFrames.
@@ -70,10 +189,10 @@ class BaseProcessor:
             - "clip": Adjusts the price to fit within predefined limits.
         conduct_order_checks (bool): Flag to enable or disable checks when converting orders to dictionary format.
         datetime_to_int_fields (tuple): Fields that should be converted from datetime to integer timestamps.
-        int_to_datetime_fields (tuple): Fields to convert from integer timestamps to pandas datetime.
-        str_to_datetime_fields (tuple): Fields with string timestamps to convert to pandas datetime.
-        numeric_fields (tuple): Fields that should be cast to numeric types.
-        bool_fields (tuple): Fields that should be cast to boolean types.
+        int_to_datetime_fields (frozenset): Fields to convert from integer timestamps to pandas datetime.
+        str_to_datetime_fields (frozenset): Fields with string timestamps to convert to pandas datetime.
+        numeric_fields (frozenset): Fields that should be cast to numeric types.
+        bool_fields (frozenset): Fields that should be cast to boolean types.
         ohlcv_fields (tuple): Standard OHLCV (Open, High, Low, Close, Volume) column names.
     """
 
@@ -87,152 +206,160 @@ class BaseProcessor:
     cost_out_of_range: Literal["warn", "clip"] = "warn"
     amount_out_of_range: Literal["warn", "clip"] = "warn"
     price_out_of_range: Literal["warn", "clip"] = "warn"
-    int_to_datetime_fields: tuple = field(
+    int_to_datetime_fields: frozenset = field(
         repr=False,
-        default=(
-            "createTime",
-            "created",
-            "createDate",
-            "expiry",
-            "expiryDate",
-            "fundingTimestamp",
-            "lastTradeTimestamp",
-            "lastUpdateTimestamp",
-            "nextFundingTimestamp",
-            "previousFundingTimestamp",
-            "time",
-            "timestamp",
-            "updateTime",
+        default=frozenset(
+            {
+                "createTime",
+                "created",
+                "createDate",
+                "expiry",
+                "expiryDate",
+                "fundingTimestamp",
+                "lastTradeTimestamp",
+                "lastUpdateTimestamp",
+                "nextFundingTimestamp",
+                "previousFundingTimestamp",
+                "time",
+                "timestamp",
+                "updateTime",
+            }
         ),
     )
-    str_to_datetime_fields: tuple = field(
+    str_to_datetime_fields: frozenset = field(
         repr=False,
-        default=(
-            "datetime",
-            "expiryDatetime",
-            "fundingDatetime",
-            "nextFundingDatetime",
-            "previousFundingDatetime",
+        default=frozenset(
+            {
+                "datetime",
+                "expiryDatetime",
+                "fundingDatetime",
+                "nextFundingDatetime",
+                "previousFundingDatetime",
+            }
         ),
     )
-    numeric_fields: tuple = field(
+    numeric_fields: frozenset = field(
         repr=False,
-        default=(
-            "ask",
-            "askImpliedVolatility",
-            "askPrice",
-            "askSize",
-            "askVolume",
-            "availableBalance",
-            "average",
-            "baseRate",
-            "baseVolume",
-            "bid",
-            "bidImpliedVolatility",
-            "bidPrice",
-            "bidSize",
-            "bidVolume",
-            "buySellRatio",
-            "buyVol",
-            "change",
-            "close",
-            "collateral",
-            "collateralMarginLevel",
-            "contractSize",
-            "contracts",
-            "cost",
-            "crossUnPnl",
-            "crossWalletBalance",
-            "delta",
-            "entryPrice",
-            "estimatedSettlePrice",
-            "exercisePrice",
-            "fee",  # Potential remove?
-            "fee_cost",
-            "free",
-            "freeze",
-            "fundingRate",
-            "gamma",
-            "high",
-            "indexPrice",
-            "initialMargin",
-            "initialMarginPercentage",
-            "interestRate",
-            "last",
-            "lastPrice",
-            "leverage",
-            "liquidationPrice",
-            "locked",
-            "longAccount",
-            "longLeverage",
-            "longShortRatio",
-            "low",
-            "maker",
-            "maintMargin",
-            "maintenanceMargin",
-            "maintenanceMarginPercentage",
-            "marginBalance",
-            "marginLevel",
-            "marginRatio",
-            "markImpliedVolatility",
-            "markPrice",
-            "maxNotional",
-            "maxWithdrawAmount",
-            "network_fee",
-            "network_precision",
-            "network_limits_withdraw.min",
-            "network_limits_withdraw.max",
-            "network_limits_deposit.min",
-            "nextFundingRate",
-            "nonce",
-            "notional",
-            "open",
-            "openOrderInitialMargin",
-            # "percentage", in load_markets -> bool
-            "period",
-            "positionAmount",
-            "positionInitialMargin",
-            "precision",
-            "previousClose",
-            "previousFundingRate",
-            "price",
-            "quantity",
-            "quoteRate",
-            "quoteVolume",
-            "realStrikePrice",
-            "rho",
-            "sellVol",
-            "shortAccount",
-            "shortLeverage",
-            "strike",
-            "strikePrice",
-            "taker",
-            "theta",
-            "totalAssetOfBtc",
-            "totalCollateralValueInUSDT",
-            "totalLiabilityOfBtc",
-            "totalNetAssetOfBtc",
-            "underlyingPrice",
-            "unrealizedPnl",
-            "unrealizedProfit",
-            "vega",
-            "vwap",
-            "walletBalance",
-            "withdrawing",
+        default=frozenset(
+            {
+                "ask",
+                "askImpliedVolatility",
+                "askPrice",
+                "askSize",
+                "askVolume",
+                "availableBalance",
+                "average",
+                "baseRate",
+                "baseVolume",
+                "bid",
+                "bidImpliedVolatility",
+                "bidPrice",
+                "bidSize",
+                "bidVolume",
+                "buySellRatio",
+                "buyVol",
+                "change",
+                "close",
+                "collateral",
+                "collateralMarginLevel",
+                "contractSize",
+                "contracts",
+                "cost",
+                "crossUnPnl",
+                "crossWalletBalance",
+                "delta",
+                "entryPrice",
+                "estimatedSettlePrice",
+                "exercisePrice",
+                "fee",  # Potential remove?
+                "fee_cost",
+                "free",
+                "freeze",
+                "fundingRate",
+                "gamma",
+                "high",
+                "indexPrice",
+                "initialMargin",
+                "initialMarginPercentage",
+                "interestRate",
+                "last",
+                "lastPrice",
+                "leverage",
+                "liquidationPrice",
+                "locked",
+                "longAccount",
+                "longLeverage",
+                "longShortRatio",
+                "low",
+                "maker",
+                "maintMargin",
+                "maintenanceMargin",
+                "maintenanceMarginPercentage",
+                "marginBalance",
+                "marginLevel",
+                "marginRatio",
+                "markImpliedVolatility",
+                "markPrice",
+                "maxNotional",
+                "maxWithdrawAmount",
+                "network_fee",
+                "network_precision",
+                "network_limits_withdraw.min",
+                "network_limits_withdraw.max",
+                "network_limits_deposit.min",
+                "nextFundingRate",
+                "nonce",
+                "notional",
+                "open",
+                "openOrderInitialMargin",
+                # "percentage", in load_markets -> bool
+                "period",
+                "positionAmount",
+                "positionInitialMargin",
+                "precision",
+                "previousClose",
+                "previousFundingRate",
+                "price",
+                "quantity",
+                "quoteRate",
+                "quoteVolume",
+                "realStrikePrice",
+                "rho",
+                "sellVol",
+                "shortAccount",
+                "shortLeverage",
+                "strike",
+                "strikePrice",
+                "taker",
+                "theta",
+                "totalAssetOfBtc",
+                "totalCollateralValueInUSDT",
+                "totalLiabilityOfBtc",
+                "totalNetAssetOfBtc",
+                "underlyingPrice",
+                "unrealizedPnl",
+                "unrealizedProfit",
+                "vega",
+                "vwap",
+                "walletBalance",
+                "withdrawing",
+            }
         ),
     )
-    bool_fields: tuple = field(
+    bool_fields: frozenset = field(
         repr=False,
-        default=(
-            "active",
-            "contract",
-            "deposit",
-            "inverse",
-            "linear",
-            "withdraw",
-            "network_active",
-            "network_deposit",
-            "network_withdraw",
+        default=frozenset(
+            {
+                "active",
+                "contract",
+                "deposit",
+                "inverse",
+                "linear",
+                "withdraw",
+                "network_active",
+                "network_deposit",
+                "network_withdraw",
+            }
         ),
     )
     ohlcv_fields: tuple = field(
@@ -246,6 +373,26 @@ class BaseProcessor:
             "volume",
         ),
     )
+    _dict_converters: dict = field(init=False, repr=False, default=None)
+
+    def __post_init__(self):
+        for name in (
+            "int_to_datetime_fields",
+            "str_to_datetime_fields",
+            "numeric_fields",
+            "bool_fields",
+        ):
+            fields = getattr(self, name)
+            if fields and not isinstance(fields, frozenset):
+                setattr(self, name, frozenset(fields))
+        # Later groups take precedence, matching the order of checks before the table existed.
+        self._dict_converters = {}
+        for fields, converter in (
+            (self.numeric_fields, _value_to_numeric),
+            (self.str_to_datetime_fields, _str_to_timestamp),
+            (self.int_to_datetime_fields, _int_to_timestamp),
+        ):
+            self._dict_converters.update(dict.fromkeys(fields or (), converter))
 
     def preprocess_dict(self, data: dict) -> dict:
         """
@@ -257,16 +404,23 @@ class BaseProcessor:
         Returns:
             dict: A dictionary with properly formatted fields.
         """
-        new_data = {}
-        for key, value in data.items():
-            if self.int_to_datetime_fields and (key in self.int_to_datetime_fields):
-                value = pd.Timestamp(pd.to_numeric(value), unit="ms", tz="UTC")
-            elif self.str_to_datetime_fields and (key in self.str_to_datetime_fields):
-                value = pd.Timestamp(value, tz="UTC")
-            elif self.numeric_fields and (key in self.numeric_fields):
-                value = pd.to_numeric(value, errors="coerce")
-            if value:
-                if isinstance(value, (list, set, tuple)) or pd.notnull(value):
+        if self._dict_converters.keys().isdisjoint(data):
+            # Nothing to convert, e.g. exchange info payloads, only drop empty values.
+            new_data = {
+                key: value
+                for key, value in data.items()
+                if value is not None and _keep_value(value)
+            }
+        else:
+            new_data = {}
+            get_converter = self._dict_converters.get
+            for key, value in data.items():
+                if value is None:
+                    continue
+                converter = get_converter(key)
+                if converter is not None:
+                    value = converter(value)
+                if _keep_value(value):
                     new_data[key] = value
         if self.exchange_name:
             new_data["exchange"] = self.exchange_name
@@ -274,6 +428,55 @@ class BaseProcessor:
             new_data["account"] = self.account_name
         return new_data
 
+    def preprocess_dicts(self, data: list[dict]) -> list[dict]:
+        """
+        Preprocess a list of dictionaries, e.g. tickers buffered from repeated calls.
+
+        Gives the same fields as calling preprocess_dict on each item, but every converted
+        key is parsed with one vectorized call for the whole batch instead of once per item.
+
+        Args:
+            data (list[dict]): Dictionaries containing raw API data.
+
+        Returns:
+            list[dict]: Dictionaries with properly formatted fields.
+        """
+        converters = self._dict_converters
+        batches = {}
+        for item in data:
+            for key, value in item.items():
+                converter = converters.get(key)
+                if (
+                    value is not None
+                    and converter is not None
+                    and _is_batched(converter, value)
+                ):
+                    batches.setdefault(key, []).append(value)
+        converted = {
+            key: iter(_batch_converters[converters[key]](values))
+            for key, values in batches.items()
+        }
+        new_data = []
+        for item in data:
+            new_item = {}
+            for key, value in item.items():
+                if value is None:
+                    continue
+                converter = converters.get(key)
+                if converter is not None:
+                    if _is_batched(converter, value):
+                        value = next(converted[key])
+                    else:
+                        value = converter(value)
+                if _keep_value(value):
+                    new_item[key] = value
+            if self.exchange_name:
+                new_item["exchange"] = self.exchange_name
+            if self.account_name:
+                new_item["account"] = self.account_name
+            new_data.append(new_item)
+        return new_data
+
     def preprocess_dataframe(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Preprocess a DataFrame by converting fields based on their types.
@@ -289,39 +492,30 @@ class BaseProcessor:
         )
         if self.dropna_fields:
             data = data.dropna(axis=1, how="all")
-        columns = data.columns
-        if self.int_to_datetime_fields:
-            datetime_columns_to_convert = [
-                x for x in columns if x in self.int_to_datetime_fields
-            ]
-            if datetime_columns_to_convert:
-                data[datetime_columns_to_convert] = (
-                    data[datetime_columns_to_convert]
-                    .apply(pd.to_numeric, errors="coerce")
-                    .apply(pd.to_datetime, unit="ms", utc=True, errors="coerce")
-                )
-        if self.str_to_datetime_fields:
-            datetime_columns_to_convert = [
-                x for x in columns if x in self.str_to_datetime_fields
-            ]
-            if datetime_columns_to_convert:
-                data[datetime_columns_to_convert] = data[
-                    datetime_columns_to_convert
-                ].apply(pd.to_datetime, utc=True, errors="coerce")
-        if self.numeric_fields:
-            numeric_columns_to_convert = [
-                x for x in columns if x in self.numeric_fields
-            ]
-            if numeric_columns_to_convert:
-                data[numeric_columns_to_convert] = data[
-                    numeric_columns_to_convert
-                ].apply(pd.to_numeric, errors="coerce")
-        if self.bool_fields:
-            bool_columns_to_convert = [x for x in columns if x in self.bool_fields]
-            if bool_columns_to_convert:
-                data[bool_columns_to_convert] = data[bool_columns_to_convert].astype(
-                    bool
-                )
+        plan = plan_columns(
+            tuple(data.columns),
+            self.int_to_datetime_fields,
+            self.str_to_datetime_fields,
+            self.numeric_fields,
+            self.bool_fields,
+        )
+        if plan.int_datetime_columns:
+            values = pd.to_numeric(
+                data[list(plan.int_datetime_columns)].to_numpy().ravel(order="F"),
+                errors="coerce",
+            )
+            values = ms_to_datetime(values)
+            n_rows = len(data.index)
+            for i, column in enumerate(plan.int_datetime_columns):
+                data[column] = values[i * n_rows : (i + 1) * n_rows]
+        for column in plan.str_datetime_columns:
+            data[column] = pd.to_datetime(data[column], utc=True, errors="coerce")
+        for column in plan.numeric_columns:
+            if not pd.api.types.is_numeric_dtype(data[column]):
+                data[column] = column_to_numeric(data[column])
+        for column in plan.bool_columns:
+            if not pd.api.types.is_bool_dtype(data[column]):
+                data[column] = data[column].astype(bool)
         if self.exchange_name:
             data["exchange"] = self.exchange_name
         if self.account_name:
@@ -412,21 +606,23 @@ class BaseProcessor:
         Returns:
             pd.DataFrame: A preprocessed order book DataFrame.
         """
-        dfs = []
-        if isinstance(data, list):
-            keys = data[0].keys()
+        books = [data] if isinstance(data, dict) else data
+        meta = [x for x in books[0].keys() if x in possible_depth_meta]
+        sides = [
+            (book, x, book.get(x) or []) for book in books for x in ["asks", "bids"]
+        ]
+        counts = [len(levels) for _, _, levels in sides]
+        levels = [level for _, _, side_levels in sides for level in side_levels]
+        if levels:
+            # ccxt only appends the count or id of a level when the exchange sends it.
+            width = max(len(level) for level in levels)
+            data = pd.DataFrame(data=records_to_array(levels, width=width))
         else:
-            keys = data.keys()
-        meta = [x for x in keys if x in possible_depth_meta]
-        for x in ["asks", "bids"]:
-            df = pd.json_normalize(
-                data=data,
-                record_path=x,
-                meta=meta,
-            )
-            df["side"] = x
-            dfs.append(df)
-        data = pd.concat(dfs, ignore_index=True).rename(
+            data = pd.DataFrame()
+        for x in meta:
+            data[x] = np.repeat([book.get(x) for book, _, _ in sides], counts)
+        data["side"] = np.repeat([x for _, x, _ in sides], counts)
+        data = data.rename(
             columns={0: "price", 1: "qty", "T": "timestamp", "u": "updateId"}
         )
         if not data.empty:
@@ -446,13 +642,11 @@ class BaseProcessor:
             pd.DataFrame: A preprocessed DataFrame containing combined order book information
                           for all symbols, including price, quantity, and metadata.
         """
-        df = []
-        for symbol, symbol_data in data.items():
-            symbol_data = self.order_book_to_dataframe(symbol_data)
-            if not symbol_data.empty:
-                symbol_data["symbol"] = symbol
-                df.append(symbol_data.copy())
-        return pd.concat(df, ignore_index=True)
+        if not data:
+            return pd.DataFrame()
+        return self.order_book_to_dataframe(
+            [{**symbol_data, "symbol": symbol} for symbol, symbol_data in data.items()]
+        )
 
     def ohlcv_to_dataframe(self, data: list, symbol: str | None = None) -> pd.DataFrame:
         """
@@ -465,7 +659,22 @@ class BaseProcessor:
         Returns:
             pd.DataFrame: A preprocessed OHLCV DataFrame.
         """
-        data = self.response_to_dataframe(data, column_names=self.ohlcv_fields)
+        # The layout is fixed, so columns are typed directly instead of going
+        # through the generic preprocess_dataframe dispatch.
+        values = records_to_array(data, width=len(self.ohlcv_fields))
+        columns = {}
+        for i, column in enumerate(self.ohlcv_fields):
+            if self.dropna_fields and np.isnan(values[:, i]).all():
+                continue
+            if self.int_to_datetime_fields and column in self.int_to_datetime_fields:
+                columns[column] = ms_to_datetime(values[:, i])
+            else:
+                columns[column] = values[:, i]
+        data = pd.DataFrame(data=columns)
+        if self.exchange_name:
+            data["exchange"] = self.exchange_name
+        if self.account_name:
+            data["account"] = self.account_name
         if symbol:
             data["symbol"] = symbol
         return data
@@ -494,6 +703,9 @@ class BaseProcessor:
         """
         Convert order data into a pandas DataFrame.
 
+        With attach_trades_to_orders, each trade becomes a row of its order and the trade
+        fields are converted by their own names before getting the "trade_" prefix.
+
         Args:
             data (list): A list of order dictionaries.
 
@@ -502,39 +714,18 @@ class BaseProcessor:
         """
         orders = pd.DataFrame(data=data)
         if self.attach_trades_to_orders:
-            trades = pd.json_normalize(
-                data=data,
-                record_path="trades",
-                meta=[
-                    "id",
-                    "clientOrderId",
-                    "timestamp",
-                    "datetime",
-                    "lastTradeTimestamp",
-                    "lastUpdateTimestamp",
-                    "symbol",
-                    "type",
-                    "timeInForce",
-                    "postOnly",
-                    "reduceOnly",
-                    "side",
-                    "price",
-                    "triggerPrice",
-                    "amount",
-                    "cost",
-                    "average",
-                    "filled",
-                    "remaining",
-                    "status",
-                    "fee",
-                    "fees",
-                    "stopPrice",
-                    "takeProfitPrice",
-                    "stopLossPrice",
-                ],
-            )
+            trades = normalize_records(data=data, record_path="trades")
             if not trades.empty:
-                orders = orders.drop(columns=["trades"]).merge(trades, how="outer")
+                order_ids = [x["id"] for x in data for _ in x.get("trades") or []]
+                trades = (
+                    self.preprocess_dataframe(trades)
+                    .drop(columns=["exchange", "account"], errors="ignore")
+                    .add_prefix("trade_")
+                )
+                trades["id"] = order_ids
+                orders = orders.drop(columns=["trades"]).merge(
+                    trades, on="id", how="outer"
+                )
         return self.preprocess_dataframe(orders)
 
     def orders_to_dict(self, orders: pd.DataFrame, exchange: ccxt.Exchange) -> list:
@@ -553,42 +744,27 @@ class BaseProcessor:
             self.order_schema.validate(orders)
         fields = determine_mandatory_optional_fields_pandera(self.order_schema)
         fields["optional"] = [x for x in orders.columns if x in fields["optional"]]
+        symbols = orders["symbol"].to_numpy()
         if "price" in orders.columns:
-            orders["price"] = orders.apply(
-                lambda x: exchange.price_to_precision(
-                    symbol=x["symbol"], price=x["price"]
-                ),
-                axis=1,
+            orders["price"] = values_to_precision(
+                exchange.price_to_precision, symbols, orders["price"].to_numpy()
             )
-        orders["amount"] = orders.apply(
-            lambda x: exchange.amount_to_precision(
-                symbol=x["symbol"], amount=x["amount"]
-            ),
-            axis=1,
+        orders["amount"] = values_to_precision(
+            exchange.amount_to_precision, symbols, orders["amount"].to_numpy()
+        )
+        return dataframe_to_records(
+            orders, columns=fields["mandatory"] + fields["optional"]
         )
-        return orders[fields["mandatory"] + fields["optional"]].to_dict("records")
 
     def preprocess_outputs(
         self, method_name: str, result: dict | list, symbol: str | None = None
     ) -> dict | list | pd.DataFrame:
-        if method_name in standard_dataframe_methods:
-            result = self.response_to_dataframe(data=result)
-        elif method_name in markets_dataframe_methods:
-            result = self.markets_to_dataframe(data=result)
-        elif method_name in currencies_dataframe_methods:
-            result = self.currencies_to_dataframe(data=result)
-        elif method_name in balance_dataframe_methods:
-            result = self.balance_to_dataframe(data=result)
-        elif method_name in ohlcv_dataframe_methods:
-            result = self.ohlcv_to_dataframe(data=result, symbol=symbol)
-        elif method_name in orderbook_dataframe_methods:
-            result = self.order_book_to_dataframe(data=result)
-        elif method_name in orderbooks_dataframe_methods:
-            result = self.order_books_to_dataframe(data=result)
-        elif method_name in orders_dataframe_methods:
-            result = self.orders_to_dataframe(data=result)
-        elif method_name in ohlcv_symbols_dataframe_methods:
-            result = self.ohlcv_symbols_to_dataframe(data=result)
-        elif method_name in dict_methods:
-            result = self.preprocess_dict(data=result)
-        return result
+        if isinstance(result, (bytes, bytearray, memoryview)):
+            # Raw JSON payloads, e.g. stored or relayed responses.
+            result = orjson.loads(result)
+        processor = output_processors.get(method_name)
+        if processor is None:
+            return result
+        if processor == "ohlcv_to_dataframe":
+            return self.ohlcv_to_dataframe(data=result, symbol=symbol)
+        return getattr(self, processor)(data=result)
@@ -1,29 +1,27 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
-from typing import Literal, Callable, Union
+from typing import Any, Callable, Literal, Union
 import ccxt
 import pandas as pd
 from dataclasses import dataclass, field
 
 from cachetools.func import ttl_cache
+from requests.adapters import HTTPAdapter
 
-from crypto_pandas.ccxt.base_processor import BaseProcessor
+from crypto_pandas.ccxt.base_pandas_exchange import BasePandasExchange
 from crypto_pandas.ccxt.method_mappings import (
-    bulk_order_methods,
-    single_order_methods,
-    symbol_order_methods,
+    market_order_methods,
     modified_methods,
+    read_methods,
 )
 from crypto_pandas.utils.ccxt_pandas_exchange_typed import CCXTPandasExchangeTyped
-from crypto_pandas.utils.pandas_utils import (
-    timestamp_to_int,
-    preprocess_order,
-    preprocess_order_dataframe,
-)
-from crypto_pandas.utils.utils import exchange_has_method
+from crypto_pandas.utils.pandas_utils import concat_results
 
 
 @dataclass
-class CCXTPandasExchange(CCXTPandasExchangeTyped):
+class CCXTPandasExchange(BasePandasExchange, CCXTPandasExchangeTyped):
     """
     CCXTPandasExchange is a wrapper for the CCXT library that integrates with Pandas
     to provide streamlined data processing for cryptocurrency exchanges. It enables users
@@ -48,106 +46,262 @@ class CCXTPandasExchange(CCXTPandasExchangeTyped):
         price_out_of_range (str): Defines behavior when price exceeds allowable ranges. Options include:
             - "warn": Logs a warning while removing the order.
             - "clip": Adjusts the price to fit within predefined limits.
+        max_retries (int): Number of times a call failing with a transient network error is retried.
+            Order actions are only retried when rejected by rate limiting. Defaults to 0, no retries.
+        retry_base_delay (float): Delay in seconds before the first retry, doubled on every attempt.
+        retry_max_delay (float): Maximum delay in seconds between retries.
+        circuit_breaker_threshold (int): Number of consecutive network errors after which calls fail
+            fast with `ccxt.ExchangeNotAvailable`. Defaults to 0, disabled.
+        circuit_breaker_cooldown (float): Seconds before a single probe call is let through an open circuit.
+        response_cache_time (dict[str, float]): Seconds for which the results of the given fetch methods
+            are cached by arguments, e.g. {"fetch_trading_fees": 60}. Defaults to no caching.
+        stale_if_error (bool): Whether a cached method failing with a network error returns its last
+            result instead of raising.
+        http_pool_maxsize (int | None): Maximum number of keep-alive connections kept per host by the
+            exchange's requests session. Defaults to the requests pool size (10).
+        coalesce_requests (bool): Whether identical fetch calls made concurrently from several threads
+            share a single request, each caller receiving its own copy of the result.
         _ccxt_processor (BaseProcessor): A helper class to process CCXT responses and provide consistent output.
+        _in_flight (dict): Pending coalesced requests by call key.
+        _in_flight_lock (threading.Lock): Guards `_in_flight`.
 
     Methods:
         __getattr__(method_name: str): Overridden to enable dynamic method resolution for CCXT methods,
                                        with transformations applied to handle inputs and outputs as Pandas DataFrames.
         load_cached_markets(params: dict = {}): Loads and caches market data from the exchange.
+        gather_for_symbols(method_name: str, symbols: list[str], errors: str = "raise", max_workers: int | None = None, **kwargs):
+            Calls a method for each symbol from a thread pool and concatenates the results.
+        gather_methods(calls: list[tuple[str, dict]], max_workers: int | None = None):
+            Calls several different methods from a thread pool and returns their results in order.
     """
 
     exchange: ccxt.Exchange = field(default_factory=ccxt.binance)
-    exchange_name: str | None = None
-    account_name: str | None = None
-    dropna_fields: bool = True
-    attach_trades_to_orders: bool = False
-    max_order_cost: float = 10_000
-    max_number_of_orders: int = 5
-    markets_cache_time: int = 3600
-    cost_out_of_range: Literal["warn", "clip"] = "warn"
-    amount_out_of_range: Literal["warn", "clip"] = "warn"
-    price_out_of_range: Literal["warn", "clip"] = "warn"
-    _ccxt_processor: BaseProcessor = field(default_factory=BaseProcessor)
+    http_pool_maxsize: int | None = None
+    coalesce_requests: bool = False
+    _in_flight: dict = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _in_flight_lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+    _cached_load_markets: Callable = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self):
-        if self.exchange_name is None:
-            self.exchange_name = self.exchange.id
-        self._ccxt_processor = BaseProcessor(
-            exchange_name=self.exchange_name,
-            account_name=self.account_name,
-            dropna_fields=self.dropna_fields,
-            attach_trades_to_orders=self.attach_trades_to_orders,
-            cost_out_of_range=self.cost_out_of_range,
-            amount_out_of_range=self.amount_out_of_range,
-            price_out_of_range=self.price_out_of_range,
-        )
+        super().__post_init__()
+
+        # Built once so the TTL cache outlives a single load_cached_markets call.
+        @ttl_cache(ttl=self.markets_cache_time)
+        def cached_load_markets() -> pd.DataFrame:
+            return self.load_markets(reload=True)
+
+        self._cached_load_markets = cached_load_markets
+        if self.http_pool_maxsize:
+            adapter = HTTPAdapter(pool_maxsize=self.http_pool_maxsize)
+            self.exchange.session.mount("https://", adapter)
+            self.exchange.session.mount("http://", adapter)
+        self._serialize_throttle()
+
+    def _serialize_throttle(self) -> None:
+        """
+        Makes the exchange's rate limiter safe to call from several threads.
+
+        ccxt's sync `throttle` compares the time since `lastRestRequestTimestamp` without a
+        lock, and the timestamp is only updated once throttling returns. Threads calling at
+        once would all see the same elapsed time and send together, so the check and the
+        update of the timestamp are done under a lock.
+        """
+        exchange = self.exchange
+        throttle = exchange.throttle
+        lock = threading.Lock()
+
+        def serialized_throttle(cost=None):
+            with lock:
+                throttle(cost)
+                exchange.lastRestRequestTimestamp = exchange.milliseconds()
+
+        exchange.throttle = serialized_throttle
 
     def __getattribute__(self, method_name: str) -> Callable:
         if method_name not in modified_methods:
             return super().__getattribute__(method_name)
         original_method = getattr(self.exchange, method_name)
+        cached = self._wrapped_methods.get(method_name)
+        if cached is not None and cached.__wrapped__ == original_method:
+            return cached
+        # Resolved once per method instead of on every call.
+        needs_markets = method_name in market_order_methods
+        is_read = method_name in read_methods
+        preprocess_kwargs = self._preprocess_kwargs
+        preprocess_outputs = self._ccxt_processor.preprocess_outputs
+        retry_delay = self._retry_delay
+
+        def send(args: tuple, kwargs: dict) -> Union[dict, pd.DataFrame]:
+            attempt = 0
+            while True:
+                self._check_circuit()
+                try:
+                    result = original_method(*args, **kwargs)
+                    break
+                except ccxt.NetworkError as error:
+                    self._record_call(error)
+                    delay = retry_delay(method_name, attempt, error)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    attempt += 1
+            self._record_call()
+            return preprocess_outputs(
+                method_name=method_name, result=result, symbol=kwargs.get("symbol")
+            )
 
         @wraps(original_method)
         def wrapped(*args, **kwargs) -> Union[dict, pd.DataFrame]:
-            if "since" in kwargs:
-                kwargs["since"] = timestamp_to_int(kwargs["since"])
-            if method_name in single_order_methods:
-                kwargs["amount"], kwargs["price"] = preprocess_order(
-                    exchange=self.exchange,
-                    symbol=kwargs["symbol"],
-                    order_type=kwargs["type"],
-                    amount=kwargs.get("amount"),
-                    price=kwargs.get("price"),
-                    cost=kwargs.get("cost"),
-                    markets=self.load_cached_markets(),
-                    max_cost=self.max_order_cost,
-                    cost_out_of_range=self.cost_out_of_range,
-                    amount_out_of_range=self.amount_out_of_range,
-                    price_out_of_range=self.price_out_of_range,
-                )
-                if "cost" in kwargs:
-                    kwargs.pop("cost")
-            elif method_name in bulk_order_methods:
-                kwargs["orders"] = preprocess_order_dataframe(
-                    orders=kwargs["orders"],
-                    markets=self.load_cached_markets(),
-                    max_orders=self.max_number_of_orders,
-                    max_cost=self.max_order_cost,
-                    cost_out_of_range=self.cost_out_of_range,
-                    amount_out_of_range=self.amount_out_of_range,
-                    price_out_of_range=self.price_out_of_range,
-                )
-                kwargs["orders"] = self._ccxt_processor.orders_to_dict(
-                    orders=kwargs["orders"],
-                    exchange=self.exchange,
-                )
-            elif method_name in symbol_order_methods:
-                kwargs["orders"] = kwargs["orders"][["id", "symbol"]].to_dict("records")
-            result = original_method(*args, **kwargs)
-            result = self._ccxt_processor.preprocess_outputs(
-                method_name=method_name, result=result, symbol=kwargs.get("symbol")
+            markets = self.load_cached_markets() if needs_markets else None
+            kwargs = preprocess_kwargs(
+                method_name=method_name, kwargs=kwargs, markets=markets
             )
+            if not is_read:
+                return send(args, kwargs)
+            ttl = self.response_cache_time.get(method_name)
+            if not (ttl or self.coalesce_requests):
+                return send(args, kwargs)
+            key = self._request_key(method_name, args, kwargs)
+            if ttl:
+                result = self._cached_response(key)
+                if result is not None:
+                    return result
+            try:
+                if self.coalesce_requests:
+                    result = self._single_flight(
+                        key=key, call=lambda: send(args, kwargs)
+                    )
+                else:
+                    result = send(args, kwargs)
+            except ccxt.NetworkError:
+                if not (ttl and self.stale_if_error):
+                    raise
+                result = self._cached_response(key, stale=True)
+                if result is None:
+                    raise
+                return result
+            if ttl:
+                self._cache_response(key, ttl, result)
+                return self._copy_result(result)
             return result
 
+        self._wrapped_methods[method_name] = wrapped
         return wrapped
 
+    def _single_flight(self, key: bytes, call: Callable[[], Any]) -> Any:
+        """
+        Runs a call once for all threads concurrently requesting the same key.
+
+        Args:
+            key (bytes): The key identifying the call.
+            call (Callable[[], Any]): Makes the call, only invoked if none is pending.
+
+        Returns:
+            Any: A copy of the call result, so callers can modify it independently.
+        """
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+        if is_leader:
+            try:
+                future.set_result(call())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._in_flight_lock:
+                    del self._in_flight[key]
+        return self._copy_result(future.result())
+
     def load_cached_markets(self, params: dict = {}) -> pd.DataFrame:
         """
-        Loads market data from the exchange and caches it.
+        Loads market data from the exchange and caches it for `markets_cache_time` seconds.
 
         Args:
             params (dict, optional): Additional parameters for the exchange's market-loading function.
-                Defaults to an empty dictionary.
+                Defaults to an empty dictionary. Calls with params bypass the cache.
 
         Returns:
             pd.DataFrame: A DataFrame containing the market data.
         """
-
-        @ttl_cache(ttl=self.markets_cache_time)
-        def _cached_load_markets() -> pd.DataFrame:
+        if params:
             return self.load_markets(reload=True, params=params)
+        return self._cached_load_markets()
+
+    def gather_for_symbols(
+        self,
+        method_name: str,
+        symbols: list[str],
+        errors: Literal["raise", "warn", "ignore"] = "raise",
+        max_workers: int | None = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Calls a method for each symbol concurrently and concatenates the results.
 
-        return _cached_load_markets()
+        Requests run in a thread pool sharing the exchange session, so N symbols cost
+        roughly N / max_workers round-trips instead of N sequential ones. With the exchange's
+        `enableRateLimit`, requests are still started at most once per `rateLimit`, only their
+        round-trips overlap.
+
+        Args:
+            method_name (str): Name of a symbol-based method, e.g. "fetch_ohlcv" or "fetch_ticker".
+            symbols (list[str]): Symbols to request.
+            errors (str): Behavior for failed requests, one of "raise", "warn" or "ignore".
+            max_workers (int | None): Number of threads. Defaults to `http_pool_maxsize`, or the
+                requests pool size (10) so that every thread keeps its connection alive.
+            **kwargs: Additional keyword arguments passed to every call.
+
+        Returns:
+            pd.DataFrame: The concatenated results of all symbols.
+        """
+        method = getattr(self, method_name)
 
-    def has_method(self, method_name: str) -> bool:
-        return exchange_has_method(self.exchange, method_name)
+        def call(symbol: str) -> pd.DataFrame | dict | Exception:
+            try:
+                return method(symbol=symbol, **kwargs)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers or self.http_pool_maxsize or 10
+        ) as executor:
+            results = list(executor.map(call, symbols))
+        return concat_results(results=results, errors=errors)
+
+    def gather_methods(
+        self,
+        calls: list[tuple[str, dict]],
+        max_workers: int | None = None,
+    ) -> list:
+        """
+        Calls several methods concurrently, e.g. the balance, open orders and trades of an account.
+
+        As in `gather_for_symbols`, requests are started at most once per `rateLimit` when the
+        exchange's `enableRateLimit` is set, only their round-trips overlap.
+
+        Args:
+            calls (list[tuple[str, dict]]): Method names with the keyword arguments of each call,
+                e.g. [("fetch_balance", {}), ("fetch_my_trades", {"symbol": "BTC/USDT"})].
+            max_workers (int | None): Number of threads. Defaults to `http_pool_maxsize`, or the
+                requests pool size (10).
+
+        Returns:
+            list: The result of each call, in the order of `calls`. The first failed call raises.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_workers or self.http_pool_maxsize or 10
+        ) as executor:
+            futures = [
+                executor.submit(getattr(self, method_name), **kwargs)
+                for method_name, kwargs in calls
+            ]
+            return [future.result() for future in futures]
@@ -20,6 +20,7 @@ standard_dataframe_methods = {
     "fetch_cross_borrow_rates",
     "fetch_deposit_addresses",
     "fetch_deposits",
+    "fetch_deposits_ws",
     "fetch_deposits_withdrawals",
     "fetch_funding_history",
     "fetch_funding_rate_history",
@@ -33,19 +34,23 @@ standard_dataframe_methods = {
     "fetch_my_dust_trades",
     "fetch_my_liquidations",
     "fetch_my_trades",
+    "fetch_my_trades_ws",
     "fetch_open_interest_history",
     "fetch_option_positions",
     "fetch_order_trades",
     "fetch_position_history",
     "fetch_positions",
+    "fetch_positions_ws",
     "fetch_positions_history",
     "fetch_positions_risk",
     "fetch_settlement_history",
     "fetch_trades",
+    "fetch_trades_ws",
     "fetch_transaction_fees",
     "fetch_transfers",
     "fetch_volatility_history",
     "fetch_withdrawals",
+    "fetch_withdrawals_ws",
     "watch_liquidations",
     "watch_liquidations_for_symbols",
     "watch_my_liquidations",
@@ -68,7 +73,9 @@ markets_dataframe_methods = {
     "fetch_mark_prices",
     "fetch_option_chain",
     "fetch_tickers",
+    "fetch_tickers_ws",
     "fetch_trading_fees",
+    "fetch_trading_fees_ws",
     "load_markets",
     "watch_bids_asks",
     "watch_funding_rates",
@@ -76,11 +83,19 @@ markets_dataframe_methods = {
     "watch_tickers",
 }
 currencies_dataframe_methods = {"fetch_currencies", "fetch_deposit_withdraw_fees"}
-balance_dataframe_methods = {"fetch_balance", "watch_balance"}
-ohlcv_dataframe_methods = {"fetch_ohlcv", "fetchOHLCV", "watch_ohlcv", "watchOHLCV"}
+balance_dataframe_methods = {"fetch_balance", "fetch_balance_ws", "watch_balance"}
+ohlcv_dataframe_methods = {
+    "fetch_ohlcv",
+    "fetchOHLCV",
+    "fetch_ohlcv_ws",
+    "fetchOHLCVWs",
+    "watch_ohlcv",
+    "watchOHLCV",
+}
 ohlcv_symbols_dataframe_methods = {"watch_ohlcv_for_symbols", "watchOHLCVForSymbols"}
 orderbook_dataframe_methods = {
     "fetch_order_book",
+    "fetch_order_book_ws",
     "watch_order_book",
     "watch_order_book_for_symbols",
 }
@@ -89,10 +104,13 @@ orders_dataframe_methods = {
     "fetch_canceled_and_closed_orders",
     "fetch_canceled_orders",
     "fetch_closed_orders",
+    "fetch_closed_orders_ws",
     "fetch_open_orders",
+    "fetch_open_orders_ws",
     "fetch_orders",
     "fetch_orders_by_ids",
     "fetch_orders_by_status",
+    "fetch_orders_by_status_ws",
     "fetch_orders_classic",
     "fetch_orders_ws",
     "watch_orders",
@@ -115,9 +133,12 @@ dict_methods = {
     "fetch_open_interest",
     "fetch_option",
     "fetch_order",
+    "fetch_order_ws",
     "fetch_position",
+    "fetch_position_ws",
     "fetch_status",
     "fetch_ticker",
+    "fetch_ticker_ws",
     "fetch_trade",
     "fetch_trading_fee",
     "fetch_deposit_withdraw_fee",
@@ -158,6 +179,30 @@ dataframe_methods = (
     | ohlcv_dataframe_methods
     | ohlcv_symbols_dataframe_methods
     | orderbook_dataframe_methods
+    | orderbooks_dataframe_methods
     | orders_dataframe_methods
 )
 modified_methods = dataframe_methods | dict_methods
+async_modified_methods = modified_methods | {"close"}
+market_order_methods = single_order_methods | bulk_order_methods
+order_action_methods = {
+    x for x in modified_methods if x.startswith(("create", "edit", "cancel"))
+}
+read_methods = {x for x in modified_methods if x.startswith(("fetch", "load"))}
+market_loading_methods = {x for x in modified_methods if x.startswith("load")}
+# Name of the BaseProcessor method converting the output of each wrapped method, in
+# reverse priority so that the first matching group wins for names in several groups.
+output_processors = {}
+for methods, processor in [
+    (dict_methods, "preprocess_dict"),
+    (ohlcv_symbols_dataframe_methods, "ohlcv_symbols_to_dataframe"),
+    (orders_dataframe_methods, "orders_to_dataframe"),
+    (orderbooks_dataframe_methods, "order_books_to_dataframe"),
+    (orderbook_dataframe_methods, "order_book_to_dataframe"),
+    (ohlcv_dataframe_methods, "ohlcv_to_dataframe"),
+    (balance_dataframe_methods, "balance_to_dataframe"),
+    (currencies_dataframe_methods, "currencies_to_dataframe"),
+    (markets_dataframe_methods, "markets_to_dataframe"),
+    (standard_dataframe_methods, "response_to_dataframe"),
+]:
+    output_processors.update(dict.fromkeys(methods, processor))
@@ -70,7 +70,7 @@ import pandas as pd\n\n
     """A Class to add type hinting to {class_name}"""
 '''
     lines = []
-    for method_name in modified_methods:
+    for method_name in sorted(modified_methods):
         if hasattr(base, method_name):
             method = getattr(base, method_name)
             try:
@@ -8,622 +8,884 @@ import pandas as pd
 class CCXTPandasExchangeTyped(Protocol):
     """A Class to add type hinting to CCXTPandasExchangeTyped"""
 
-    def watch_order_book_for_symbols(
-        self, symbols: List[str], limit: Int = None, params={}
+    def cancel_all_orders(
+        self, symbol: str | None = None, params: dict = {}
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_order_book_for_symbols"""
+        """Returns a pd.DataFrame from ccxt.cancel_all_orders"""
         ...
 
-    def watch_ticker(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.watch_ticker"""
+    def cancel_all_orders_ws(
+        self, symbol: str | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.cancel_all_orders_ws"""
         ...
 
-    def watch_funding_rate(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.watch_funding_rate"""
+    def cancel_order(
+        self, id: str, symbol: str | None = None, params: dict = {}
+    ) -> dict:
+        """Returns a dict from ccxt.cancel_order"""
         ...
 
-    def watch_trades(
+    def cancel_order_ws(
+        self, id: str, symbol: str | None = None, params: dict = {}
+    ) -> dict:
+        """Returns a dict from ccxt.cancel_order_ws"""
+        ...
+
+    def cancel_orders(
+        self, ids: list, symbol: str | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.cancel_orders"""
+        ...
+
+    def cancel_orders_for_symbols(
+        self, orders: pd.DataFrame, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.cancel_orders_for_symbols"""
+        ...
+
+    def cancel_orders_ws(
+        self, ids: list, symbol: str | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.cancel_orders_ws"""
+        ...
+
+    def create_order(
         self,
         symbol: str,
-        since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
-    ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_trades"""
+        type: OrderType,
+        side: OrderSide,
+        amount: float,
+        price: None | str | float | int | Decimal = None,
+        params: dict = {},
+    ) -> dict:
+        """Returns a dict from ccxt.create_order"""
         ...
 
-    def fetch_tickers(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_tickers"""
+    def create_order_ws(
+        self,
+        symbol: str,
+        type: OrderType,
+        side: OrderSide,
+        amount: float,
+        price: None | str | float | int | Decimal = None,
+        params: dict = {},
+    ) -> dict:
+        """Returns a dict from ccxt.create_order_ws"""
         ...
 
-    def watch_ohlcv_for_symbols(
+    def create_orders(self, orders: pd.DataFrame, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.create_orders"""
+        ...
+
+    def create_orders_ws(self, orders: pd.DataFrame, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.create_orders_ws"""
+        ...
+
+    def edit_order(
         self,
-        symbolsAndTimeframes: List[List[str]],
-        since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
-    ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_ohlcv_for_symbols"""
+        id: str,
+        symbol: str,
+        type: OrderType,
+        side: OrderSide,
+        amount: None | str | float | int | Decimal = None,
+        price: None | str | float | int | Decimal = None,
+        params: dict = {},
+    ) -> dict:
+        """Returns a dict from ccxt.edit_order"""
         ...
 
-    def watch_orders_for_symbols(
+    def edit_order_ws(
         self,
-        symbols: List[str],
-        since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
-    ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_orders_for_symbols"""
+        id: str,
+        symbol: str,
+        type: OrderType,
+        side: OrderSide,
+        amount: None | str | float | int | Decimal = None,
+        price: None | str | float | int | Decimal = None,
+        params: dict = {},
+    ) -> dict:
+        """Returns a dict from ccxt.edit_order_ws"""
         ...
 
-    def fetch_greeks(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_greeks"""
+    def edit_orders(self, orders: pd.DataFrame, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.edit_orders"""
         ...
 
-    def fetch_deposit_addresses(self, codes: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_deposit_addresses"""
+    def fetch_accounts(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_accounts"""
         ...
 
-    def fetch_cross_borrow_rates(self, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_cross_borrow_rates"""
+    def fetch_all_greeks(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_all_greeks"""
         ...
 
-    def fetch_funding_rates(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_funding_rates"""
+    def fetch_balance(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_balance"""
         ...
 
-    def watch_tickers(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_tickers"""
+    def fetch_balance_ws(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_balance_ws"""
         ...
 
-    def fetch_isolated_borrow_rates(self, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_isolated_borrow_rates"""
+    def fetch_bids_asks(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_bids_asks"""
         ...
 
-    def fetch_transfers(
+    def fetch_borrow_interest(
         self,
-        code: Str = None,
+        code: str | None = None,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_transfers"""
+        """Returns a pd.DataFrame from ccxt.fetch_borrow_interest"""
         ...
 
-    def watch_my_liquidations(
+    def fetch_canceled_and_closed_orders(
         self,
-        symbol: str,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_my_liquidations"""
+        """Returns a pd.DataFrame from ccxt.fetch_canceled_and_closed_orders"""
         ...
 
-    def watch_liquidations_for_symbols(
+    def fetch_canceled_orders(
         self,
-        symbols: List[str],
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_liquidations_for_symbols"""
+        """Returns a pd.DataFrame from ccxt.fetch_canceled_orders"""
         ...
 
-    def fetch_positions_risk(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_positions_risk"""
+    def fetch_closed_orders(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_closed_orders"""
         ...
 
-    def fetch_trading_fee(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_trading_fee"""
+    def fetch_closed_orders_ws(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_closed_orders_ws"""
         ...
 
-    def fetch_ledger(
+    def fetch_convert_currencies(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_convert_currencies"""
+        ...
+
+    def fetch_convert_trade_history(
         self,
-        code: Str = None,
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_ledger"""
+        """Returns a pd.DataFrame from ccxt.fetch_convert_trade_history"""
         ...
 
-    def fetch_leverages(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_leverages"""
+    def fetch_cross_borrow_rate(self, code: str, params={}) -> dict:
+        """Returns a dict from ccxt.fetch_cross_borrow_rate"""
         ...
 
-    def cancel_order(self, id: str, symbol: Str = None, params={}) -> dict:
-        """Returns a dict from ccxt.cancel_order"""
+    def fetch_cross_borrow_rates(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_cross_borrow_rates"""
         ...
 
-    def fetch_bids_asks(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_bids_asks"""
+    def fetch_currencies(self, params={}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_currencies"""
         ...
 
-    def fetch_funding_history(
+    def fetch_deposit_addresses(
+        self, codes: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_deposit_addresses"""
+        ...
+
+    def fetch_deposit_withdraw_fee(self, code: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_deposit_withdraw_fee"""
+        ...
+
+    def fetch_deposit_withdraw_fees(
+        self, codes: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_deposit_withdraw_fees"""
+        ...
+
+    def fetch_deposits(
         self,
-        symbol: Str = None,
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_funding_history"""
+        """Returns a pd.DataFrame from ccxt.fetch_deposits"""
         ...
 
-    def watch_my_trades_for_symbols(
+    def fetch_deposits_withdrawals(
         self,
-        symbols: List[str],
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_my_trades_for_symbols"""
+        """Returns a pd.DataFrame from ccxt.fetch_deposits_withdrawals"""
         ...
 
-    def watch_liquidations(
+    def fetch_deposits_ws(
         self,
-        symbol: str,
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_liquidations"""
+        """Returns a pd.DataFrame from ccxt.fetch_deposits_ws"""
         ...
 
-    def create_order(
+    def fetch_funding_history(
         self,
-        symbol: str,
-        type: OrderType,
-        side: OrderSide,
-        amount: float,
-        price: Union[NoneType, str, float, int, Decimal] = None,
-        params={},
-    ) -> dict:
-        """Returns a dict from ccxt.create_order"""
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_funding_history"""
         ...
 
-    def fetch_position(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_position"""
+    def fetch_funding_interval(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_funding_interval"""
         ...
 
-    def watch_positions(
+    def fetch_funding_intervals(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_funding_intervals"""
+        ...
+
+    def fetch_funding_rate(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_funding_rate"""
+        ...
+
+    def fetch_funding_rate_history(
         self,
-        symbols: Strings = None,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_positions"""
+        """Returns a pd.DataFrame from ccxt.fetch_funding_rate_history"""
         ...
 
-    def edit_orders(self, orders: pd.DataFrame, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.edit_orders"""
+    def fetch_funding_rates(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_funding_rates"""
         ...
 
-    def fetch_my_liquidations(
+    def fetch_greeks(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_greeks"""
+        ...
+
+    def fetch_isolated_borrow_rate(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_isolated_borrow_rate"""
+        ...
+
+    def fetch_isolated_borrow_rates(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_isolated_borrow_rates"""
+        ...
+
+    def fetch_last_prices(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_last_prices"""
+        ...
+
+    def fetch_ledger(
         self,
-        symbol: Str = None,
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_my_liquidations"""
+        """Returns a pd.DataFrame from ccxt.fetch_ledger"""
         ...
 
-    def watch_bids_asks(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_bids_asks"""
+    def fetch_leverage_tiers(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_leverage_tiers"""
         ...
 
-    def fetch_open_interest(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_open_interest"""
+    def fetch_leverages(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_leverages"""
         ...
 
-    def watch_trades_for_symbols(
+    def fetch_liquidations(
         self,
-        symbols: List[str],
+        symbol: str,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_trades_for_symbols"""
+        """Returns a pd.DataFrame from ccxt.fetch_liquidations"""
         ...
 
-    def watch_balance(self, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_balance"""
+    def fetch_long_short_ratio_history(
+        self,
+        symbol: str | None = None,
+        timeframe: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_long_short_ratio_history"""
         ...
 
-    def fetch_currencies(self, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_currencies"""
+    def fetch_margin_adjustment_history(
+        self,
+        symbol: str | None = None,
+        type: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: None | str | float | int | Decimal = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_margin_adjustment_history"""
         ...
 
-    def fetch_transaction_fees(self, codes: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_transaction_fees"""
+    def fetch_margin_modes(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_margin_modes"""
         ...
 
-    def fetch_isolated_borrow_rate(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_isolated_borrow_rate"""
+    def fetch_mark_price(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_mark_price"""
+        ...
+
+    def fetch_mark_prices(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_mark_prices"""
         ...
 
     def fetch_markets(self, params={}) -> pd.DataFrame:
         """Returns a pd.DataFrame from ccxt.fetch_markets"""
         ...
 
-    def fetch_orders(
+    def fetch_my_liquidations(
         self,
-        symbol: Str = None,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_orders"""
+        """Returns a pd.DataFrame from ccxt.fetch_my_liquidations"""
         ...
 
-    def fetch_last_prices(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_last_prices"""
+    def fetch_my_trades(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_my_trades"""
         ...
 
-    def fetch_margin_modes(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_margin_modes"""
+    def fetch_my_trades_ws(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_my_trades_ws"""
         ...
 
-    def fetch_funding_rate(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_funding_rate"""
+    def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_ohlcv"""
         ...
 
-    def fetch_mark_prices(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_mark_prices"""
+    def fetch_ohlcv_ws(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_ohlcv_ws"""
         ...
 
-    def fetch_order(self, id: str, symbol: Str = None, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_order"""
+    def fetch_open_interest(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_open_interest"""
         ...
 
-    def fetch_positions_history(
+    def fetch_open_interest_history(
         self,
-        symbols: Strings = None,
+        symbol: str,
+        timeframe: str = "1h",
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_positions_history"""
+        """Returns a pd.DataFrame from ccxt.fetch_open_interest_history"""
         ...
 
-    def watch_funding_rates(self, symbols: List[str], params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_funding_rates"""
+    def fetch_open_orders(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_open_orders"""
         ...
 
-    def create_orders(self, orders: pd.DataFrame, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.create_orders"""
+    def fetch_open_orders_ws(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_open_orders_ws"""
         ...
 
-    def fetch_status(self, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_status"""
+    def fetch_option(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_option"""
         ...
 
-    def fetch_option_chain(self, code: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_option_chain"""
+    def fetch_option_chain(self, code: str, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_option_chain"""
+        ...
+
+    def fetch_order(
+        self, id: str, symbol: str | None = None, params: dict = {}
+    ) -> dict:
+        """Returns a dict from ccxt.fetch_order"""
         ...
 
     def fetch_order_book(
-        self, symbol: str, limit: Int = None, params={}
+        self, symbol: str, limit: int | None = None, params: dict = {}
     ) -> pd.DataFrame:
         """Returns a pd.DataFrame from ccxt.fetch_order_book"""
         ...
 
-    def fetch_open_interest_history(
+    def fetch_order_book_ws(
+        self, symbol: str, limit: int | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_order_book_ws"""
+        ...
+
+    def fetch_order_books(
         self,
-        symbol: str,
-        timeframe: str = "1h",
-        since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        symbols: list[str] | None = None,
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_open_interest_history"""
+        """Returns a pd.DataFrame from ccxt.fetch_order_books"""
         ...
 
-    def watch_my_liquidations_for_symbols(
+    def fetch_order_trades(
         self,
-        symbols: List[str],
+        id: str,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_my_liquidations_for_symbols"""
+        """Returns a pd.DataFrame from ccxt.fetch_order_trades"""
         ...
 
-    def fetch_leverage_tiers(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_leverage_tiers"""
+    def fetch_order_ws(
+        self, id: str, symbol: str | None = None, params: dict = {}
+    ) -> dict:
+        """Returns a dict from ccxt.fetch_order_ws"""
         ...
 
-    def fetch_margin_adjustment_history(
+    def fetch_orders(
         self,
-        symbol: Str = None,
-        type: Str = None,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Union[NoneType, str, float, int, Decimal] = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_margin_adjustment_history"""
+        """Returns a pd.DataFrame from ccxt.fetch_orders"""
         ...
 
-    def fetch_long_short_ratio_history(
+    def fetch_orders_by_status_ws(
         self,
-        symbol: Str = None,
-        timeframe: Str = None,
+        status: str,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_long_short_ratio_history"""
+        """Returns a pd.DataFrame from ccxt.fetch_orders_by_status_ws"""
         ...
 
-    def fetch_positions(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_positions"""
+    def fetch_orders_ws(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_orders_ws"""
         ...
 
-    def fetch_liquidations(
+    def fetch_position(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_position"""
+        ...
+
+    def fetch_position_history(
         self,
         symbol: str,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_liquidations"""
+        """Returns a pd.DataFrame from ccxt.fetch_position_history"""
         ...
 
-    def fetch_funding_rate_history(
+    def fetch_position_ws(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_position_ws"""
+        ...
+
+    def fetch_positions(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_positions"""
+        ...
+
+    def fetch_positions_history(
         self,
-        symbol: Str = None,
+        symbols: list[str] | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_funding_rate_history"""
+        """Returns a pd.DataFrame from ccxt.fetch_positions_history"""
         ...
 
-    def fetch_mark_price(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_mark_price"""
+    def fetch_positions_risk(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_positions_risk"""
         ...
 
-    def fetch_withdrawals(
-        self,
-        code: Str = None,
-        since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+    def fetch_positions_ws(
+        self, symbols: list[str] | None = None, params: dict = {}
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_withdrawals"""
+        """Returns a pd.DataFrame from ccxt.fetch_positions_ws"""
         ...
 
-    def fetch_deposits(
-        self,
-        code: Str = None,
-        since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+    def fetch_status(self, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_status"""
+        ...
+
+    def fetch_ticker(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_ticker"""
+        ...
+
+    def fetch_ticker_ws(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_ticker_ws"""
+        ...
+
+    def fetch_tickers(
+        self, symbols: list[str] | None = None, params: dict = {}
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_deposits"""
+        """Returns a pd.DataFrame from ccxt.fetch_tickers"""
         ...
 
-    def edit_order(
-        self,
-        id: str,
-        symbol: str,
-        type: OrderType,
-        side: OrderSide,
-        amount: Union[NoneType, str, float, int, Decimal] = None,
-        price: Union[NoneType, str, float, int, Decimal] = None,
-        params={},
-    ) -> dict:
-        """Returns a dict from ccxt.edit_order"""
+    def fetch_tickers_ws(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_tickers_ws"""
         ...
 
-    def fetch_open_orders(
+    def fetch_trades(
         self,
-        symbol: Str = None,
+        symbol: str,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_open_orders"""
+        """Returns a pd.DataFrame from ccxt.fetch_trades"""
         ...
 
-    def fetch_order_trades(
+    def fetch_trades_ws(
         self,
-        id: str,
-        symbol: Str = None,
+        symbol: str,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_order_trades"""
+        """Returns a pd.DataFrame from ccxt.fetch_trades_ws"""
+        ...
+
+    def fetch_trading_fee(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.fetch_trading_fee"""
         ...
 
-    def fetch_trading_fees(self, params={}) -> pd.DataFrame:
+    def fetch_trading_fees(self, params: dict = {}) -> pd.DataFrame:
         """Returns a pd.DataFrame from ccxt.fetch_trading_fees"""
         ...
 
-    def fetch_ticker(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_ticker"""
+    def fetch_trading_fees_ws(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.fetch_trading_fees_ws"""
         ...
 
-    def fetch_convert_trade_history(
-        self,
-        code: Str = None,
-        since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+    def fetch_transaction_fees(
+        self, codes: list[str] | None = None, params: dict = {}
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_convert_trade_history"""
+        """Returns a pd.DataFrame from ccxt.fetch_transaction_fees"""
         ...
 
-    def fetch_canceled_and_closed_orders(
+    def fetch_transfers(
         self,
-        symbol: Str = None,
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_canceled_and_closed_orders"""
+        """Returns a pd.DataFrame from ccxt.fetch_transfers"""
         ...
 
-    def fetch_borrow_interest(
+    def fetch_withdrawals(
         self,
-        code: Str = None,
-        symbol: Str = None,
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_borrow_interest"""
+        """Returns a pd.DataFrame from ccxt.fetch_withdrawals"""
         ...
 
-    def fetch_my_trades(
+    def fetch_withdrawals_ws(
         self,
-        symbol: Str = None,
+        code: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_my_trades"""
+        """Returns a pd.DataFrame from ccxt.fetch_withdrawals_ws"""
         ...
 
-    def cancel_orders_for_symbols(
-        self, orders: pd.DataFrame, params={}
-    ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.cancel_orders_for_symbols"""
+    def load_markets(self, reload=False, params={}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.load_markets"""
         ...
 
-    def fetch_deposit_withdraw_fee(self, code: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_deposit_withdraw_fee"""
+    def watch_balance(self, params: dict = {}) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_balance"""
         ...
 
-    def fetch_option(self, symbol: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_option"""
+    def watch_bids_asks(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_bids_asks"""
         ...
 
-    def watch_order_book(
-        self, symbol: str, limit: Int = None, params={}
+    def watch_funding_rate(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.watch_funding_rate"""
+        ...
+
+    def watch_funding_rates(
+        self, symbols: list[str] | None = None, params: dict = {}
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_order_book"""
+        """Returns a pd.DataFrame from ccxt.watch_funding_rates"""
         ...
 
-    def fetch_ohlcv(
+    def watch_liquidations(
         self,
         symbol: str,
-        timeframe="1m",
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_ohlcv"""
+        """Returns a pd.DataFrame from ccxt.watch_liquidations"""
         ...
 
-    def watch_orders(
+    def watch_liquidations_for_symbols(
         self,
-        symbol: Str = None,
+        symbols: list,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_orders"""
+        """Returns a pd.DataFrame from ccxt.watch_liquidations_for_symbols"""
         ...
 
-    def fetch_position_history(
+    def watch_mark_price(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.watch_mark_price"""
+        ...
+
+    def watch_mark_prices(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_mark_prices"""
+        ...
+
+    def watch_my_liquidations(
         self,
         symbol: str,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_position_history"""
+        """Returns a pd.DataFrame from ccxt.watch_my_liquidations"""
         ...
 
-    def fetch_trades(
+    def watch_my_liquidations_for_symbols(
         self,
-        symbol: str,
+        symbols: list,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_trades"""
+        """Returns a pd.DataFrame from ccxt.watch_my_liquidations_for_symbols"""
         ...
 
-    def cancel_all_orders(self, symbol: Str = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.cancel_all_orders"""
+    def watch_my_trades(
+        self,
+        symbol: str | None = None,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_my_trades"""
         ...
 
-    def fetch_convert_currencies(self, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_convert_currencies"""
+    def watch_my_trades_for_symbols(
+        self,
+        symbols: list,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_my_trades_for_symbols"""
         ...
 
-    def fetch_deposits_withdrawals(
+    def watch_ohlcv(
         self,
-        code: Str = None,
+        symbol: str,
+        timeframe: str = "1m",
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_deposits_withdrawals"""
+        """Returns a pd.DataFrame from ccxt.watch_ohlcv"""
         ...
 
-    def fetch_balance(self, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_balance"""
+    def watch_ohlcv_for_symbols(
+        self,
+        symbolsAndTimeframes: list,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_ohlcv_for_symbols"""
         ...
 
-    def watch_position(self, symbol: Str = None, params={}) -> dict:
-        """Returns a dict from ccxt.watch_position"""
+    def watch_order_book(
+        self, symbol: str, limit: int | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_order_book"""
         ...
 
-    def fetch_closed_orders(
+    def watch_order_book_for_symbols(
+        self, symbols: list, limit: int | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_order_book_for_symbols"""
+        ...
+
+    def watch_orders(
         self,
-        symbol: Str = None,
+        symbol: str | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_closed_orders"""
+        """Returns a pd.DataFrame from ccxt.watch_orders"""
         ...
 
-    def fetch_accounts(self, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_accounts"""
+    def watch_orders_for_symbols(
+        self,
+        symbols: list,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_orders_for_symbols"""
         ...
 
-    def fetch_all_greeks(self, symbols: Strings = None, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_all_greeks"""
+    def watch_position(self, symbol: str | None = None, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.watch_position"""
         ...
 
-    def watch_ohlcv(
+    def watch_positions(
         self,
-        symbol: str,
-        timeframe="1m",
+        symbols: list[str] | None = None,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_ohlcv"""
+        """Returns a pd.DataFrame from ccxt.watch_positions"""
         ...
 
-    def fetch_deposit_withdraw_fees(
-        self, codes: Strings = None, params={}
-    ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.fetch_deposit_withdraw_fees"""
+    def watch_ticker(self, symbol: str, params: dict = {}) -> dict:
+        """Returns a dict from ccxt.watch_ticker"""
         ...
 
-    def load_markets(self, reload=False, params={}) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.load_markets"""
+    def watch_tickers(
+        self, symbols: list[str] | None = None, params: dict = {}
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_tickers"""
         ...
 
-    def fetch_cross_borrow_rate(self, code: str, params={}) -> dict:
-        """Returns a dict from ccxt.fetch_cross_borrow_rate"""
+    def watch_trades(
+        self,
+        symbol: str,
+        since: int | pd.Timestamp | dict | str | None = None,
+        limit: int | None = None,
+        params: dict = {},
+    ) -> pd.DataFrame:
+        """Returns a pd.DataFrame from ccxt.watch_trades"""
         ...
 
-    def watch_my_trades(
+    def watch_trades_for_symbols(
         self,
-        symbol: Str = None,
+        symbols: list,
         since: int | pd.Timestamp | dict | str | None = None,
-        limit: Int = None,
-        params={},
+        limit: int | None = None,
+        params: dict = {},
     ) -> pd.DataFrame:
-        """Returns a pd.DataFrame from ccxt.watch_my_trades"""
+        """Returns a pd.DataFrame from ccxt.watch_trades_for_symbols"""
         ...
@@ -1,6 +1,7 @@
 import asyncio
 import warnings
-from typing import Literal, Awaitable, Any, overload
+from itertools import chain
+from typing import Literal, Awaitable, Any, Callable, Iterable, overload
 
 import ccxt
 import numpy as np
@@ -24,25 +25,24 @@ def format_timestamp(timestamp: int | pd.Timestamp | dict | str) -> pd.Timestamp
 def format_timestamp(
     timestamp: int | pd.Timestamp | dict | str | None,
 ) -> pd.Timestamp | None:
-    now = pd.Timestamp.now(tz="UTC")
     if isinstance(timestamp, dict):
-        timestamp = now + pd.DateOffset(**timestamp)
+        timestamp = pd.Timestamp.now(tz="UTC") + pd.DateOffset(**timestamp)
     elif isinstance(timestamp, str):
-        timestamp = now + pd.Timedelta(timestamp)
+        timestamp = pd.Timestamp.now(tz="UTC") + pd.Timedelta(timestamp)
     return timestamp
 
 
 def timestamp_to_int(timestamp: int | pd.Timestamp | dict | str | None) -> int:
     timestamp = format_timestamp(timestamp)
     if isinstance(timestamp, pd.Timestamp):
-        timestamp = int(timestamp.timestamp() * 1000)
+        timestamp = timestamp.value // 1_000_000
     return timestamp
 
 
 def date_time_fields_to_int_str(data: dict) -> dict:
     def transform_value(value):
         if isinstance(value, pd.Timestamp):
-            return str(int(value.timestamp() * 1000))
+            return str(value.value // 1_000_000)
         elif isinstance(value, dict):
             return date_time_fields_to_int_str(value)
         elif isinstance(value, list):
@@ -61,11 +61,20 @@ def date_time_columns_to_int_str(data: pd.DataFrame) -> pd.DataFrame:
     return data
 
 
+def has_dict_values(values: np.ndarray) -> bool:
+    """Checks whether an array holds dict values, skipping arrays pandas infers as scalar."""
+    if values.dtype != object:
+        return False
+    if pd.api.types.infer_dtype(values, skipna=True) not in ("mixed", "mixed-integer"):
+        return False
+    return any(isinstance(value, dict) for value in values)
+
+
 def expand_dict_columns(data: pd.DataFrame, separator: str = ".") -> pd.DataFrame:
     data = data.reset_index(drop=True)
-    dict_columns = [
-        x for x in data.columns if any(data[x].apply(lambda y: isinstance(y, dict)))
-    ]
+    dict_columns = [x for x in data.columns if has_dict_values(data[x].to_numpy())]
+    if not dict_columns:
+        return data
     columns_list = [data.drop(columns=dict_columns).copy()]
     for dict_column in dict_columns:
         exploded_column = pd.json_normalize(data[dict_column])
@@ -76,6 +85,155 @@ def expand_dict_columns(data: pd.DataFrame, separator: str = ".") -> pd.DataFram
     return pd.concat(columns_list, axis=1)
 
 
+# Epoch milliseconds representable as datetime64[ns].
+max_datetime_ms = pd.Timestamp.max.value // 1_000_000
+
+
+def ms_to_datetime(values: np.ndarray) -> pd.DatetimeIndex:
+    """
+    Convert epoch milliseconds to ``datetime64[ns, UTC]``.
+
+    Whole milliseconds are cast through ``datetime64[ms]``, which avoids the per-element
+    unit handling of ``pd.to_datetime(unit="ms")``. Missing and out of bounds values
+    become NaT, fractional milliseconds fall back to ``pd.to_datetime``.
+
+    Args:
+        values (np.ndarray): Integer or float epoch milliseconds.
+
+    Returns:
+        pd.DatetimeIndex: The UTC datetimes.
+    """
+    values = np.asarray(values)
+    valid = np.abs(values) <= max_datetime_ms
+    if values.dtype.kind == "f":
+        valid &= ~np.isnan(values)
+        if not np.array_equal(values[valid], np.trunc(values[valid])):
+            return pd.to_datetime(values, unit="ms", utc=True, errors="coerce")
+    datetimes = np.where(valid, values, 0).astype(np.int64).astype("datetime64[ms]")
+    datetimes[~valid] = np.datetime64("NaT")
+    return pd.DatetimeIndex(datetimes.astype("datetime64[ns]")).tz_localize("UTC")
+
+
+def records_to_array(records: list, width: int) -> np.ndarray:
+    """
+    Stack fixed-width numeric rows, e.g. OHLCV candles or order book levels, into a float64 array.
+
+    Rows are streamed into a buffer allocated once from the known length instead of going
+    through the nested list conversion of ``np.array``. Shorter rows, e.g. order book levels
+    without a count, are padded with NaN.
+
+    Args:
+        records (list): Rows of numbers, missing values as None.
+        width (int): Number of values of the widest row.
+
+    Returns:
+        np.ndarray: Array of shape (len(records), width).
+    """
+    if all(len(row) == width for row in records):
+        return np.fromiter(
+            chain.from_iterable(records), np.float64, count=len(records) * width
+        ).reshape(-1, width)
+    values = np.full((len(records), width), np.nan)
+    for i, row in enumerate(records):
+        values[i, : len(row)] = row
+    return values
+
+
+def column_to_numeric(column: pd.Series) -> pd.Series:
+    """
+    Cast a column of numbers or numeric strings to float64.
+
+    ``astype`` parses in a single C loop, several times faster than ``pd.to_numeric``.
+    Columns holding values it cannot parse fall back to ``pd.to_numeric`` with coercion,
+    as do columns of whole numbers, e.g. ids or nonces, so that they keep int64 precision.
+
+    Args:
+        column (pd.Series): The column to convert.
+
+    Returns:
+        pd.Series: The numeric column.
+    """
+    try:
+        values = column.astype(np.float64)
+    except (TypeError, ValueError):
+        return pd.to_numeric(column, errors="coerce")
+    array = values.to_numpy()
+    array = array[~np.isnan(array)]
+    if np.array_equal(array, np.trunc(array)):
+        return pd.to_numeric(column, errors="coerce")
+    return values
+
+
+def dataframe_to_records(data: pd.DataFrame, columns: list | None = None) -> list[dict]:
+    """
+    Convert a DataFrame into a list of dictionaries, one per row.
+
+    Same output as ``data[columns].to_dict("records")``, but zips per-column lists
+    instead of boxing every cell through the row iterator, about twice as fast.
+
+    Args:
+        data (pd.DataFrame): The DataFrame to convert.
+        columns (list | None): Columns to keep, defaults to all columns.
+
+    Returns:
+        list[dict]: The rows as dictionaries with native Python values.
+    """
+    if columns is None:
+        columns = list(data.columns)
+    values = []
+    for column in columns:
+        column_values = data[column].tolist()
+        if isinstance(data[column].dtype, pd.api.extensions.ExtensionDtype):
+            # Like to_dict, missing values of nullable dtypes are returned as None.
+            column_values = [None if x is pd.NA else x for x in column_values]
+        values.append(column_values)
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def normalize_records(
+    data: dict | list,
+    record_path: str,
+    meta: list | tuple = (),
+    record_prefix: str | None = None,
+) -> pd.DataFrame:
+    """
+    Flatten the records stored under ``record_path`` and broadcast ``meta`` fields onto them.
+
+    Lightweight replacement for ``pd.json_normalize`` on ccxt payloads, whose records
+    (order book levels, order trades) are already flat. Meta fields may be given as a key
+    or a list of nested keys and take precedence over record fields of the same name.
+
+    Args:
+        data (dict | list): A payload or list of payloads holding the records.
+        record_path (str): Key of the records inside each payload.
+        meta (list | tuple): Fields of each payload to repeat on every record.
+        record_prefix (str | None): Prefix added to the record columns, e.g. "trade_".
+
+    Returns:
+        pd.DataFrame: One row per record with the meta fields as trailing columns.
+    """
+    if isinstance(data, dict):
+        data = [data]
+    meta_names = [x if isinstance(x, str) else ".".join(x) for x in meta]
+    meta_paths = [(x,) if isinstance(x, str) else tuple(x) for x in meta]
+    rows = []
+    meta_values = {name: [] for name in meta_names}
+    for item in data:
+        records = item.get(record_path) or []
+        rows.extend(records)
+        for name, path in zip(meta_names, meta_paths):
+            value = item
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            meta_values[name].extend([value] * len(records))
+    df = pd.DataFrame(data=rows)
+    if record_prefix:
+        df = df.add_prefix(record_prefix)
+    for name, values in meta_values.items():
+        df[name] = values
+    return df
+
+
 def determine_mandatory_optional_fields_pandera(model: pa.DataFrameModel) -> dict:
     schema = model.to_schema()
     fields = {"mandatory": [], "optional": []}
@@ -87,12 +245,29 @@ def determine_mandatory_optional_fields_pandera(model: pa.DataFrameModel) -> dic
     return fields
 
 
-def combine_params(row: pd.Series, param_cols: list) -> dict:
-    return {
-        column.replace("params.", ""): row[column]
-        for column in param_cols
-        if pd.notnull(row[column])
-    }
+def values_to_precision(
+    precision_method: Callable, symbols: Iterable, values: Iterable
+) -> list:
+    """
+    Apply an exchange precision method (e.g. ``price_to_precision``) to each value.
+
+    The method is only called once per distinct (symbol, value) pair, as bulk orders
+    such as grids typically repeat the same amounts and prices.
+
+    Args:
+        precision_method (Callable): Exchange method taking a symbol and a value.
+        symbols (Iterable): Symbol of each value.
+        values (Iterable): Values to format.
+
+    Returns:
+        list: The formatted values, in the input order.
+    """
+    keys = list(zip(symbols, values))
+    formatted = {}
+    for key in keys:
+        if key not in formatted:
+            formatted[key] = precision_method(*key)
+    return [formatted[key] for key in keys]
 
 
 def preprocess_order(
@@ -109,6 +284,8 @@ def preprocess_order(
     amount_out_of_range: Literal["warn", "clip"] = "warn",
 ) -> tuple:
     market = markets.query(f"symbol == '{symbol}'").reindex(columns=order_data_columns)
+    if market.empty:
+        raise ValueError(f"Unknown symbol {symbol}.")
     market[cap_zero_columns] = market[cap_zero_columns].fillna(0)
     market[cap_inf_columns] = market[cap_inf_columns].fillna(np.inf)
     market = market.to_dict("records")[0]
@@ -130,12 +307,16 @@ def preprocess_order(
             out_of_range = cost_out_of_range
         else:
             out_of_range = amount_out_of_range
+        if pd.isnull(value):
+            # e.g. the price of a market order, there is nothing to check.
+            new_values[key] = value
+            continue
         limits_min = market[f"limits_{key}.min"]
         limits_max = market[f"limits_{key}.max"]
         if out_of_range == "warn":
             if not limits_min <= value <= limits_max:
                 warnings.warn(
-                    f"{key} {amount} outside limits {limits_min}, {limits_max}."
+                    f"{key} {value} outside limits {limits_min}, {limits_max}."
                 )
                 value = None
         else:
@@ -204,7 +385,17 @@ def preprocess_order_dataframe(
                 )
     if "params" not in orders.columns:
         param_cols = orders.columns[orders.columns.str.startswith("params.")]
-        orders["params"] = orders.apply(combine_params, axis=1, param_cols=param_cols)
+        param_names = [column.replace("params.", "") for column in param_cols]
+        param_values = orders[param_cols].to_numpy(dtype=object)
+        param_notnull = orders[param_cols].notna().to_numpy()
+        orders["params"] = [
+            {
+                name: value
+                for name, value, notnull in zip(param_names, values, notnull_values)
+                if notnull
+            }
+            for values, notnull_values in zip(param_values, param_notnull)
+        ]
     return orders
 
 
@@ -244,7 +435,11 @@ def concat_results(
             errors_results.append(x)
     if errors_results:
         if errors == "raise":
-            raise ValueError(f"Errors encountered: {errors_results}")
+            # Chain the first exception so its type and traceback are not lost.
+            cause = next(
+                (x for x in errors_results if isinstance(x, BaseException)), None
+            )
+            raise ValueError(f"Errors encountered: {errors_results}") from cause
         elif errors == "warn":
             warnings.warn(f"Errors encountered: {errors_results}")
     if clean_results:
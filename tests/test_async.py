@@ -1,8 +1,193 @@
 import asyncio
+import copy
+import time
 
 import ccxt.pro as ccxt
+import pytest
+
 from crypto_pandas.ccxt.async_ccxt_pandas_exchange import AsyncCCXTPandasExchange
-from tests.test_sync import sandbox_settings
+from tests.test_sync import StubExchange, sandbox_settings, symbol
+
+
+class AsyncStubExchange(ccxt.binance):
+    """Async binance answering from memory, to test the wrappers offline."""
+
+    responses = StubExchange.responses
+
+    def __init__(self, config: dict | None = None, errors=(), latency: float = 0.0):
+        super().__init__(config or {"enableRateLimit": False})
+        self.errors = list(errors)
+        self.latency = latency
+        self.requests = []
+
+    def sign(
+        self, path, api="public", method="GET", params={}, headers=None, body=None
+    ):
+        return {"url": path, "method": method, "headers": headers, "body": body}
+
+    async def fetch(self, url, method="GET", headers=None, body=None):
+        self.requests.append((url, time.monotonic()))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.errors:
+            raise self.errors.pop(0)
+        return copy.deepcopy(self.responses[url])
+
+    async def load_markets(self, reload=False, params={}):
+        return self.set_markets(list((await self.fetch2("markets")).values()))
+
+    async def fetch_ticker(self, symbol, params={}):
+        return await self.fetch2("ticker", params={"symbol": symbol})
+
+    async def cancel_order(self, id, symbol=None, params={}):
+        return await self.fetch2("order", method="DELETE", params={"id": id})
+
+
+def run(coroutine_function, exchange):
+    async def run_and_close():
+        try:
+            return await coroutine_function()
+        finally:
+            await exchange.close()
+
+    return asyncio.run(run_and_close())
+
+
+def test_retry_network_error():
+    exchange = AsyncStubExchange(errors=[ccxt.RequestTimeout("timeout")] * 2)
+    pandas_exchange = AsyncCCXTPandasExchange(
+        exchange=exchange, max_retries=2, retry_base_delay=0
+    )
+    data = run(lambda: pandas_exchange.fetch_ticker(symbol=symbol), exchange)
+    assert data["last"] == 600.0
+    assert len(exchange.requests) == 3
+
+
+def test_retry_max_retries():
+    exchange = AsyncStubExchange(errors=[ccxt.RequestTimeout("timeout")] * 5)
+    pandas_exchange = AsyncCCXTPandasExchange(
+        exchange=exchange, max_retries=2, retry_base_delay=0
+    )
+    with pytest.raises(ccxt.RequestTimeout):
+        run(lambda: pandas_exchange.fetch_ticker(symbol=symbol), exchange)
+    assert len(exchange.requests) == 3
+
+
+def test_retry_order_actions():
+    exchange = AsyncStubExchange(
+        errors=[ccxt.RequestTimeout("timeout"), ccxt.RateLimitExceeded("429")]
+    )
+    pandas_exchange = AsyncCCXTPandasExchange(
+        exchange=exchange, max_retries=2, retry_base_delay=0
+    )
+
+    async def cancel_twice():
+        with pytest.raises(ccxt.RequestTimeout):
+            await pandas_exchange.cancel_order(id="1", symbol=symbol)
+        assert len(exchange.requests) == 1
+        return await pandas_exchange.cancel_order(id="1", symbol=symbol)
+
+    data = run(cancel_twice, exchange)
+    assert data["status"] == "canceled"
+    assert len(exchange.requests) == 3
+
+
+def test_retry_backoff(monkeypatch):
+    exchange = AsyncStubExchange(errors=[ccxt.RequestTimeout("timeout")] * 3)
+    pandas_exchange = AsyncCCXTPandasExchange(
+        exchange=exchange, max_retries=3, retry_base_delay=1, retry_max_delay=1.5
+    )
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    run(lambda: pandas_exchange.fetch_ticker(symbol=symbol), exchange)
+    print(delays)
+    # Later sleeps come from closing the exchange.
+    assert 1 <= delays[0] <= 1.5
+    assert delays[1:3] == [1.5, 1.5]
+
+
+def test_close_with_open_circuit():
+    exchange = AsyncStubExchange(errors=[ccxt.RequestTimeout("timeout")] * 2)
+    pandas_exchange = AsyncCCXTPandasExchange(
+        exchange=exchange, circuit_breaker_threshold=2, circuit_breaker_cooldown=60
+    )
+
+    async def fail_and_close():
+        for _ in range(2):
+            with pytest.raises(ccxt.RequestTimeout):
+                await pandas_exchange.fetch_ticker(symbol=symbol)
+        with pytest.raises(ccxt.ExchangeNotAvailable):
+            await pandas_exchange.fetch_ticker(symbol=symbol)
+        await pandas_exchange.close()
+
+    run(fail_and_close, exchange)
+    assert pandas_exchange._consecutive_failures == 2
+
+
+def test_coalesce_requests():
+    exchange = AsyncStubExchange(latency=0.1)
+    pandas_exchange = AsyncCCXTPandasExchange(exchange=exchange, coalesce_requests=True)
+    results = run(
+        lambda: asyncio.gather(
+            *[pandas_exchange.fetch_ticker(symbol=symbol) for _ in range(4)]
+        ),
+        exchange,
+    )
+    assert len(exchange.requests) == 1
+    assert len({id(x) for x in results}) == 4
+    results[0]["last"] = 0.0
+    assert [x["last"] for x in results[1:]] == [600.0] * 3
+    assert not pandas_exchange._in_flight
+
+
+def test_coalesce_requests_error():
+    exchange = AsyncStubExchange(errors=[ccxt.BadSymbol("bad")], latency=0.1)
+    pandas_exchange = AsyncCCXTPandasExchange(exchange=exchange, coalesce_requests=True)
+    results = run(
+        lambda: asyncio.gather(
+            *[pandas_exchange.fetch_ticker(symbol=symbol) for _ in range(4)],
+            return_exceptions=True,
+        ),
+        exchange,
+    )
+    assert len(exchange.requests) == 1
+    assert all(isinstance(x, ccxt.BadSymbol) for x in results)
+    assert not pandas_exchange._in_flight
+
+
+def test_order_semaphore():
+    exchange = AsyncStubExchange(latency=0.1)
+    pandas_exchange = AsyncCCXTPandasExchange(
+        exchange=exchange, semaphore_value=1, order_semaphore_value=1
+    )
+    finished = {}
+
+    async def timed(name, coroutine):
+        await coroutine
+        finished[name] = time.monotonic()
+
+    async def poll_and_trade():
+        await asyncio.wait_for(
+            asyncio.gather(
+                *[
+                    timed(f"poll{i}", pandas_exchange.fetch_ticker(symbol=symbol))
+                    for i in range(3)
+                ],
+                timed("markets", pandas_exchange.load_cached_markets()),
+                timed("cancel", pandas_exchange.cancel_order(id="1", symbol=symbol)),
+            ),
+            timeout=2,
+        )
+
+    run(poll_and_trade, exchange)
+    print(finished)
+    # Polls queue one after the other, orders and markets do not wait for them.
+    assert finished["poll2"] - finished["poll0"] >= 0.19
+    assert max(finished["markets"], finished["cancel"]) < finished["poll2"] - 0.05
 
 
 async def main():
@@ -22,6 +207,10 @@ async def main():
     print(order_book)
     print(bids_asks.dropna(how="all", axis=1))
     print(trades)
+    ohlcv = await pandas_exchange.gather_for_symbols(
+        "fetch_ohlcv", symbols=["BNB/USDT", "DOGE/USDT"], timeframe="1m", limit=10
+    )
+    print(ohlcv)
     orders = (
         bids_asks[["symbol", "bid"]]
         .drop_duplicates(subset=["symbol"], ignore_index=True)
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+from crypto_pandas.ccxt.base_processor import BaseProcessor
+
+processor = BaseProcessor(exchange_name="binance")
+
+
+def test_order_book_mixed_level_widths():
+    order_book = {
+        "symbol": "BTC/USDT",
+        "bids": [[100.0, 1.0], [99.0, 2.0, 3]],
+        "asks": [[101.0, 1.5, 4]],
+        "timestamp": 1_700_000_000_000,
+        "nonce": 1,
+    }
+    data = processor.preprocess_outputs("fetch_order_book", order_book)
+    print(data)
+    assert isinstance(data, pd.DataFrame)
+    assert data["price"].tolist() == [101.0, 100.0, 99.0]
+    assert data["qty"].dtype == np.float64
+    assert np.isnan(data[2][1])
+    assert data[2][[0, 2]].tolist() == [4.0, 3.0]
+
+
+def test_preprocess_dicts_matches_preprocess_dict():
+    orders = [
+        {
+            "id": str(i),
+            "timestamp": 1_700_000_000_000 + i,
+            "datetime": [
+                "2023-11-14T22:13:20.000Z",
+                "2024-01-01 00:00:00",
+                "Jan 2 2024",
+            ][i],
+            "symbol": "BTC/USDT",
+            "side": "buy",
+            "price": [101.5, "101.5", "1"][i],
+            "amount": 1.0,
+            "filled": 0,
+            "average": None,
+            "fee": {"cost": 0.01 * i, "currency": "USDT"},
+            "trades": [],
+        }
+        for i in range(3)
+    ]
+    data = processor.preprocess_dicts(orders)
+    print(data)
+    expected = [processor.preprocess_dict(x) for x in orders]
+    assert data == expected
+    assert [{k: type(v) for k, v in x.items()} for x in data] == [
+        {k: type(v) for k, v in x.items()} for x in expected
+    ]
+    assert data[0]["fee"] == {"cost": 0.0, "currency": "USDT"}
+    assert type(data[0]["price"]) is float
+    assert type(data[2]["price"]) is np.int64
+
+
+def test_integer_strings_keep_int64():
+    data = processor.preprocess_dataframe(
+        pd.DataFrame(
+            {
+                "nonce": ["9007199254740993", "2"],
+                "price": ["101.5", None],
+            }
+        )
+    )
+    print(data.dtypes)
+    assert data["nonce"].dtype == np.int64
+    assert data["nonce"][0] == 2**53 + 1
+    assert data["price"].dtype == np.float64
+
+
+def test_orders_with_trades():
+    trades_processor = BaseProcessor(
+        exchange_name="binance", attach_trades_to_orders=True
+    )
+    orders = [
+        {
+            "id": "1",
+            "timestamp": 1_700_000_000_000,
+            "symbol": "BTC/USDT",
+            "price": "100.5",
+            "amount": 2.0,
+            "trades": [
+                {
+                    "id": "t1",
+                    "order": "1",
+                    "timestamp": 1_700_000_000_100,
+                    "price": "100.5",
+                    "amount": 1.0,
+                    "fee": {"cost": "0.1", "currency": "USDT"},
+                },
+                {
+                    "id": "t2",
+                    "order": "1",
+                    "timestamp": 1_700_000_000_200,
+                    "price": "100.0",
+                    "amount": 1.0,
+                    "fee": {"cost": "0.1", "currency": "USDT"},
+                },
+            ],
+        },
+        {
+            "id": "2",
+            "timestamp": 1_700_000_000_000,
+            "symbol": "BTC/USDT",
+            "price": "99.0",
+            "amount": 1.0,
+            "trades": [],
+        },
+    ]
+    data = trades_processor.orders_to_dataframe(orders)
+    print(data)
+    assert data["id"].tolist() == ["1", "1", "2"]
+    assert data["trade_id"].tolist()[:2] == ["t1", "t2"]
+    assert pd.api.types.is_datetime64_any_dtype(data["trade_timestamp"])
+    assert data["trade_price"].dtype == np.float64
+    assert data["trade_fee_cost"].dtype == np.float64
+    assert "trade_exchange" not in data.columns
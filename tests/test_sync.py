@@ -1,10 +1,15 @@
+import copy
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import ccxt
+import numpy as np
 import pytest
 import pandas as pd
 from dotenv import load_dotenv
 
+from crypto_pandas.ccxt import base_pandas_exchange
 from crypto_pandas.ccxt.ccxt_pandas_exchange import CCXTPandasExchange
 
 load_dotenv()
@@ -32,10 +37,68 @@ okx_settings = {
 }
 coinbase_settings = {
     "apiKey": os.getenv("COINBASE_API_KEY"),
-    "secret": os.getenv("COINBASE_API_SECRET").replace("\\n", "\n"),
+    "secret": os.getenv("COINBASE_API_SECRET", "").replace("\\n", "\n"),
 }
 
 
+class StubExchange(ccxt.binance):
+    """Binance answering from memory, to test the wrappers offline."""
+
+    responses = {
+        "klines": [[1_700_000_000_000, 600.0, 601.0, 599.0, 600.5, 10.0]],
+        "ticker": {"symbol": symbol, "timestamp": 1_700_000_000_000, "last": 600.0},
+        "order": {"id": "1", "symbol": symbol, "status": "canceled"},
+        "markets": {
+            symbol: {
+                "id": "BNBUSDT",
+                "symbol": symbol,
+                "base": "BNB",
+                "quote": "USDT",
+                "type": "spot",
+                "spot": True,
+                "precision": {"amount": 0.001, "price": 0.01},
+                "limits": {"amount": {"min": 0.001}, "cost": {"min": 5.0}},
+            }
+        },
+    }
+
+    def __init__(self, config: dict | None = None, errors=(), latency: float = 0.0):
+        super().__init__(config or {"enableRateLimit": False})
+        self.errors = list(errors)
+        self.latency = latency
+        self.requests = []
+        self.orders = []
+
+    def sign(
+        self, path, api="public", method="GET", params={}, headers=None, body=None
+    ):
+        return {"url": path, "method": method, "headers": headers, "body": body}
+
+    def fetch(self, url, method="GET", headers=None, body=None):
+        self.requests.append((url, time.monotonic()))
+        if self.latency:
+            time.sleep(self.latency)
+        if self.errors:
+            raise self.errors.pop(0)
+        return copy.deepcopy(self.responses[url])
+
+    def load_markets(self, reload=False, params={}):
+        return self.set_markets(list(self.fetch2("markets").values()))
+
+    def fetch_ohlcv(self, symbol, timeframe="1m", since=None, limit=None, params={}):
+        return self.fetch2("klines", params={"symbol": symbol})
+
+    def fetch_ticker(self, symbol, params={}):
+        return self.fetch2("ticker", params={"symbol": symbol})
+
+    def create_order(self, symbol, type, side, amount, price=None, params={}):
+        self.orders.append((symbol, type, side, amount, price))
+        return self.fetch2("order", method="POST", params={"symbol": symbol})
+
+    def cancel_order(self, id, symbol=None, params={}):
+        return self.fetch2("order", method="DELETE", params={"id": id})
+
+
 @pytest.fixture(scope="module")
 def coinbase_exchange():
     exchange = ccxt.coinbase(coinbase_settings)
@@ -74,6 +137,55 @@ def test_load_markets(sandbox_exchange):
     assert isinstance(data, pd.DataFrame)
 
 
+def test_load_cached_markets():
+    exchange = StubExchange()
+    pandas_exchange = CCXTPandasExchange(exchange=exchange)
+    data = pandas_exchange.load_cached_markets()
+    print(data)
+    assert isinstance(data, pd.DataFrame)
+    pandas_exchange.load_cached_markets()
+    assert len(exchange.requests) == 1
+    # Calls with params bypass the cache.
+    pandas_exchange.load_cached_markets(params={"type": "spot"})
+    assert len(exchange.requests) == 2
+
+
+def test_create_order_validation():
+    exchange = StubExchange()
+    pandas_exchange = CCXTPandasExchange(exchange=exchange)
+    pandas_exchange.load_cached_markets()
+    exchange.requests.clear()
+    with pytest.raises(ValueError, match="bye"):
+        pandas_exchange.create_order(
+            symbol=symbol, type="limit", side="bye", amount=1.0, price=600.0
+        )
+    with pytest.raises(ValueError, match="XXX/USDT"):
+        pandas_exchange.create_order(
+            symbol="XXX/USDT", type="limit", side="buy", amount=1.0, price=600.0
+        )
+    assert exchange.requests == []
+    assert exchange.orders == []
+
+
+def test_create_market_order():
+    exchange = StubExchange()
+    pandas_exchange = CCXTPandasExchange(exchange=exchange)
+    data = pandas_exchange.create_order(
+        symbol=symbol, type="market", side="buy", amount=1.23456
+    )
+    print(data)
+    assert exchange.orders == [(symbol, "market", "buy", "1.234", None)]
+
+
+def test_create_order_out_of_range():
+    exchange = StubExchange()
+    pandas_exchange = CCXTPandasExchange(exchange=exchange)
+    with pytest.warns(UserWarning, match=r"amount 0\.0001 outside limits"):
+        pandas_exchange.create_order(
+            symbol=symbol, type="limit", side="buy", amount=0.0001, price=60000.0
+        )
+
+
 def test_fetch_balance(binance_exchange):
     data = binance_exchange.fetch_balance()
     print(data)
@@ -160,6 +272,251 @@ def test_fetch_ohlcv(sandbox_exchange):
     assert isinstance(data, pd.DataFrame)
 
 
+def test_gather_for_symbols(sandbox_exchange):
+    data = sandbox_exchange.gather_for_symbols(
+        "fetch_ohlcv", symbols=[symbol, "ETH/USDT"], timeframe="1m", limit=10
+    )
+    print(data)
+    print(data.dtypes)
+    assert isinstance(data, pd.DataFrame)
+
+
+def test_gather_for_symbols_rate_limit():
+    exchange = StubExchange({"rateLimit": 100}, latency=0.05)
+    data = CCXTPandasExchange(exchange=exchange).gather_for_symbols(
+        "fetch_ohlcv", symbols=[f"S{i}" for i in range(4)]
+    )
+    sent = sorted(t for _, t in exchange.requests)
+    print(np.diff(sent))
+    assert len(data) == 4
+    assert np.diff(sent).min() >= 0.09
+
+
+def test_gather_methods_rate_limit():
+    exchange = StubExchange({"rateLimit": 100}, latency=0.05)
+    ticker, ohlcv, order = CCXTPandasExchange(exchange=exchange).gather_methods(
+        [
+            ("fetch_ticker", {"symbol": symbol}),
+            ("fetch_ohlcv", {"symbol": symbol}),
+            ("cancel_order", {"id": "1", "symbol": symbol}),
+        ]
+    )
+    sent = sorted(t for _, t in exchange.requests)
+    print(np.diff(sent))
+    assert isinstance(ticker, dict)
+    assert isinstance(ohlcv, pd.DataFrame)
+    assert order["status"] == "canceled"
+    assert np.diff(sent).min() >= 0.09
+
+
+def test_retry_network_error():
+    exchange = StubExchange(errors=[ccxt.RequestTimeout("timeout")] * 2)
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, max_retries=2, retry_base_delay=0
+    )
+    data = pandas_exchange.fetch_ticker(symbol=symbol)
+    assert data["last"] == 600.0
+    assert len(exchange.requests) == 3
+
+
+def test_retry_max_retries():
+    exchange = StubExchange(errors=[ccxt.RequestTimeout("timeout")] * 5)
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, max_retries=2, retry_base_delay=0
+    )
+    with pytest.raises(ccxt.RequestTimeout):
+        pandas_exchange.fetch_ticker(symbol=symbol)
+    assert len(exchange.requests) == 3
+
+
+def test_retry_order_actions():
+    exchange = StubExchange(errors=[ccxt.RequestTimeout("timeout")])
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, max_retries=2, retry_base_delay=0
+    )
+    with pytest.raises(ccxt.RequestTimeout):
+        pandas_exchange.cancel_order(id="1", symbol=symbol)
+    assert len(exchange.requests) == 1
+    exchange.errors = [ccxt.RateLimitExceeded("429")]
+    data = pandas_exchange.cancel_order(id="1", symbol=symbol)
+    assert data["status"] == "canceled"
+    assert len(exchange.requests) == 3
+
+
+def test_retry_backoff(monkeypatch):
+    exchange = StubExchange(errors=[ccxt.RequestTimeout("timeout")] * 3)
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, max_retries=3, retry_base_delay=1, retry_max_delay=1.5
+    )
+    delays = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    pandas_exchange.fetch_ticker(symbol=symbol)
+    print(delays)
+    assert 1 <= delays[0] <= 1.5
+    assert delays[1:] == [1.5, 1.5]
+    assert (
+        pandas_exchange._retry_delay("fetch_ticker", 3, ccxt.RequestTimeout()) is None
+    )
+    assert pandas_exchange._retry_delay("fetch_ticker", 0, ccxt.BadSymbol()) is None
+
+
+def test_circuit_breaker():
+    exchange = StubExchange(errors=[ccxt.RequestTimeout("timeout")] * 3)
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, circuit_breaker_threshold=2, circuit_breaker_cooldown=0.1
+    )
+    for _ in range(2):
+        with pytest.raises(ccxt.RequestTimeout):
+            pandas_exchange.fetch_ticker(symbol=symbol)
+    # Open, fails fast without reaching the exchange.
+    with pytest.raises(ccxt.ExchangeNotAvailable, match="circuit open"):
+        pandas_exchange.fetch_ticker(symbol=symbol)
+    assert len(exchange.requests) == 2
+    # Half open, a failed probe opens the circuit again.
+    time.sleep(0.1)
+    with pytest.raises(ccxt.RequestTimeout):
+        pandas_exchange.fetch_ticker(symbol=symbol)
+    with pytest.raises(ccxt.ExchangeNotAvailable):
+        pandas_exchange.fetch_ticker(symbol=symbol)
+    assert len(exchange.requests) == 3
+    # A successful probe closes it.
+    time.sleep(0.1)
+    assert pandas_exchange.fetch_ticker(symbol=symbol)["last"] == 600.0
+    assert pandas_exchange._consecutive_failures == 0
+    assert pandas_exchange.fetch_ticker(symbol=symbol)["last"] == 600.0
+    assert len(exchange.requests) == 5
+
+
+def test_circuit_breaker_single_probe():
+    exchange = StubExchange(errors=[ccxt.RequestTimeout("timeout")], latency=0.1)
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, circuit_breaker_threshold=1, circuit_breaker_cooldown=0.1
+    )
+    with pytest.raises(ccxt.RequestTimeout):
+        pandas_exchange.fetch_ticker(symbol=symbol)
+    time.sleep(0.1)
+
+    def fetch_ticker(_) -> dict | Exception:
+        try:
+            return pandas_exchange.fetch_ticker(symbol=symbol)
+        except ccxt.ExchangeNotAvailable as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(fetch_ticker, range(4)))
+    # Only one thread probes, the others fail fast.
+    assert len(exchange.requests) == 2
+    assert sum(isinstance(x, dict) for x in results) == 1
+
+
+def test_response_cache():
+    exchange = StubExchange()
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, response_cache_time={"fetch_ticker": 0.1}
+    )
+    data = pandas_exchange.fetch_ticker(symbol=symbol)
+    data["last"] = 0.0
+    assert pandas_exchange.fetch_ticker(symbol=symbol)["last"] == 600.0
+    assert len(exchange.requests) == 1
+    time.sleep(0.1)
+    pandas_exchange.fetch_ticker(symbol=symbol)
+    assert len(exchange.requests) == 2
+    # Other methods are not cached.
+    pandas_exchange.fetch_ohlcv(symbol=symbol)
+    pandas_exchange.fetch_ohlcv(symbol=symbol)
+    assert len(exchange.requests) == 4
+
+
+def test_response_cache_eviction(monkeypatch):
+    monkeypatch.setattr(base_pandas_exchange, "max_cached_responses", 2)
+    exchange = StubExchange()
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange, response_cache_time={"fetch_ticker": 60}
+    )
+    for x in ["BTC/USDT", "ETH/USDT", "BTC/USDT", "BNB/USDT"]:
+        pandas_exchange.fetch_ticker(symbol=x)
+    assert len(exchange.requests) == 3
+    assert len(pandas_exchange._response_cache) == 2
+    # The oldest entry was evicted.
+    pandas_exchange.fetch_ticker(symbol="ETH/USDT")
+    assert len(exchange.requests) == 3
+    pandas_exchange.fetch_ticker(symbol="BTC/USDT")
+    assert len(exchange.requests) == 4
+
+
+def test_response_cache_copies_nested_results():
+    pandas_exchange = CCXTPandasExchange(exchange=StubExchange())
+    pandas_exchange._cache_response(b"key", 60, {"fee": {"cost": 1.0}})
+    pandas_exchange._cached_response(b"key")["fee"]["cost"] = 0.0
+    assert pandas_exchange._cached_response(b"key") == {"fee": {"cost": 1.0}}
+
+
+def test_response_cache_threads(monkeypatch):
+    monkeypatch.setattr(base_pandas_exchange, "max_cached_responses", 8)
+    pandas_exchange = CCXTPandasExchange(exchange=StubExchange())
+
+    def cache_and_read(i):
+        for j in range(200):
+            key = f"{i}-{j}".encode()
+            pandas_exchange._cache_response(key, 60, j)
+            pandas_exchange._cached_response(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(cache_and_read, range(8)))
+    assert len(pandas_exchange._response_cache) == 8
+
+
+def test_response_cache_stale_if_error():
+    exchange = StubExchange()
+    pandas_exchange = CCXTPandasExchange(
+        exchange=exchange,
+        response_cache_time={"fetch_ticker": 0.1},
+        stale_if_error=True,
+    )
+    pandas_exchange.fetch_ticker(symbol=symbol)
+    time.sleep(0.1)
+    exchange.errors = [ccxt.RequestTimeout("timeout"), ccxt.BadSymbol("bad")]
+    assert pandas_exchange.fetch_ticker(symbol=symbol)["last"] == 600.0
+    with pytest.raises(ccxt.BadSymbol):
+        pandas_exchange.fetch_ticker(symbol=symbol)
+    exchange.errors = [ccxt.RequestTimeout("timeout")]
+    with pytest.raises(ccxt.RequestTimeout):
+        pandas_exchange.fetch_ticker(symbol="ETH/USDT")
+
+
+def test_coalesce_requests():
+    exchange = StubExchange(latency=0.1)
+    pandas_exchange = CCXTPandasExchange(exchange=exchange, coalesce_requests=True)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: pandas_exchange.fetch_ticker(symbol=symbol), range(4)
+            )
+        )
+    assert len(exchange.requests) == 1
+    assert len({id(x) for x in results}) == 4
+    results[0]["last"] = 0.0
+    assert [x["last"] for x in results[1:]] == [600.0] * 3
+    assert not pandas_exchange._in_flight
+
+
+def test_coalesce_requests_error():
+    exchange = StubExchange(errors=[ccxt.BadSymbol("bad")], latency=0.1)
+    pandas_exchange = CCXTPandasExchange(exchange=exchange, coalesce_requests=True)
+
+    def fetch_ticker(_) -> Exception | None:
+        try:
+            pandas_exchange.fetch_ticker(symbol=symbol)
+        except ccxt.BadSymbol as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(fetch_ticker, range(4)))
+    assert len(exchange.requests) == 1
+    assert all(isinstance(x, ccxt.BadSymbol) for x in results)
+    assert not pandas_exchange._in_flight
+
+
 def test_fetch_status(binance_exchange):
     data = binance_exchange.fetch_status()
     print(data)